@@ -0,0 +1,145 @@
+"""Benchmark leaderboard HTML parsing per category and parser backend.
+
+Compares the old full-page BeautifulSoup(..., "html.parser") tree with the
+table-only SoupStrainer parse on each available tree builder. Pages are
+synthesized to resemble cfl.ca league-leader pages (large page chrome around
+a handful of tables), or loaded from saved pages with --page.
+
+The cfl package must be importable, so either install it (pip install -e .)
+or run from the repository root with it on the path:
+
+    PYTHONPATH=. python benchmarks/bench_html_parsing.py
+    PYTHONPATH=. python benchmarks/bench_html_parsing.py --page offence=offence.html
+"""
+
+import argparse
+import functools
+import statistics
+import time
+
+from bs4 import BeautifulSoup
+
+from cfl.html_parsing import HTML_PARSER
+from cfl.leaderboard import (
+    DEFAULT_CATEGORIES,
+    STAT_CATEGORY_MAPPING,
+    parse_leaderboard_category,
+    parse_player_table,
+)
+
+CHROME_BLOCKS = 400
+PLAYERS_PER_TABLE = 50
+
+
+def synthetic_page(category: str) -> str:
+    chrome = "".join(
+        f'<div class="nav-item"><a href="/news/{i}">Story {i}</a>'
+        f"<p>{'Lorem ipsum dolor sit amet. ' * 8}</p>"
+        f'<script>window.__data_{i} = {{"id": {i}}};</script></div>'
+        for i in range(CHROME_BLOCKS)
+    )
+    tables = "".join(
+        f"<table><thead><tr><th>{header}</th></tr></thead><tbody>"
+        + "".join(
+            '<tr class="player-tooltip-wrapper">'
+            f"<td>{rank}</td><td></td><td></td>"
+            f'<td><a href="/players/player-{rank}/{1000 + rank}">Player {rank}</a></td>'
+            f'<td>TOR</td><td><span class="leaders-stat">{rank * 37:,}</span></td>'
+            "</tr>"
+            for rank in range(1, PLAYERS_PER_TABLE + 1)
+        )
+        + "</tbody></table>"
+        for header in STAT_CATEGORY_MAPPING[category]
+    )
+
+    return f"<html><head><title>Leaders</title></head><body>{chrome}{tables}{chrome}</body></html>"
+
+
+def parse_full_tree(html_content: str, category: str) -> dict:
+    """The previous implementation: build the whole page, then find tables."""
+    soup = BeautifulSoup(html_content, "html.parser")
+    results = DEFAULT_CATEGORIES[category].copy()
+
+    for table in soup.find_all("table"):
+        header = table.find("thead")
+        if not header or not header.find("th"):
+            continue
+
+        header_text = header.find("th").text.strip().upper()
+        key = STAT_CATEGORY_MAPPING[category].get(header_text)
+        if key:
+            results[key] = parse_player_table(table)
+
+    return results
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+
+    return statistics.median(samples)
+
+
+def available_parsers() -> list[str]:
+    parsers = ["html.parser"]
+    if HTML_PARSER == "lxml":
+        parsers.append("lxml")
+
+    return parsers
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    arg_parser.add_argument(
+        "--page",
+        action="append",
+        default=[],
+        metavar="CATEGORY=PATH",
+        help="Benchmark a saved cfl.ca page instead of a synthetic one",
+    )
+    args = arg_parser.parse_args()
+
+    saved = dict(page.split("=", 1) for page in args.page)
+    pages = {}
+    for category in STAT_CATEGORY_MAPPING:
+        if category in saved:
+            with open(saved[category], encoding="utf-8") as f:
+                pages[category] = f.read()
+        else:
+            pages[category] = synthetic_page(category)
+
+    print(f"{'category':<14} {'page KB':>8} {'backend':<24} {'ms':>9} {'speedup':>8}")
+
+    for category, html_content in pages.items():
+        expected = parse_full_tree(html_content, category)
+        baseline = timed(
+            functools.partial(parse_full_tree, html_content, category), args.repeat
+        )
+        size = len(html_content) / 1024
+        print(
+            f"{category:<14} {size:>8.0f} {'full tree (html.parser)':<24} "
+            f"{baseline * 1000:>9.2f} {1:>7.1f}x"
+        )
+
+        for parser in available_parsers():
+            result = parse_leaderboard_category(html_content, category, parser)
+            assert result == expected, f"{parser} output differs for {category}"
+
+            elapsed = timed(
+                functools.partial(
+                    parse_leaderboard_category, html_content, category, parser
+                ),
+                args.repeat,
+            )
+            print(
+                f"{category:<14} {size:>8.0f} {f'tables only ({parser})':<24} "
+                f"{elapsed * 1000:>9.2f} {baseline / elapsed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
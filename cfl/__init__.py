@@ -3,6 +3,9 @@
 A modern, lightweight client for interacting with the CFL API.
 """
 
+from .async_client import AsyncCFLClient
+from .batch import BatchResult
+from .cache import CacheBackend, CachePolicy, MemoryCache, SQLiteCache
 from .client import CFLClient
 from .constants import (
     DEFAULT_LIMIT,
@@ -19,12 +22,31 @@ from .exceptions import (
     CFLAPITimeoutError,
     CFLAPIValidationError,
 )
+from .ledger_feed import LedgerFeed
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .snapshot import SeasonSnapshot, build_season_snapshot
+from .sync import IncrementalSync, SyncChange, SyncState
 
 __all__ = [
     "CFLClient",
+    "AsyncCFLClient",
+    "BatchResult",
+    "CacheBackend",
+    "CachePolicy",
+    "MemoryCache",
+    "SQLiteCache",
     "DEFAULT_LIMIT",
     "DEFAULT_PAGE",
     "DEFAULT_TIMEOUT",
+    "RetryPolicy",
+    "TokenBucket",
+    "IncrementalSync",
+    "LedgerFeed",
+    "SyncChange",
+    "SyncState",
+    "SeasonSnapshot",
+    "build_season_snapshot",
     "CFLAPIError",
     "CFLAPIConnectionError",
     "CFLAPITimeoutError",
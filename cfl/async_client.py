@@ -0,0 +1,1489 @@
+"""Async CFL API Client for accessing CFL data."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import TypeVar, cast
+
+import httpx
+
+from .base import (
+    _RESPONSE_SIZE,
+    STALE_IF_ERROR_EXCEPTIONS,
+    BaseCFLClient,
+    _PageCollector,
+)
+from .batch import BatchResult, fetch_batch_async
+from .cache import endpoint_template
+from .constants import (
+    COLLEGE_ENDPOINT,
+    COLLEGES_ENDPOINT,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_LIMIT,
+    DEFAULT_PAGE,
+    DEFAULT_SEASON,
+    FIXTURE_ENDPOINT,
+    LEADERBOARD_CATEGORIES,
+    LEDGER_ENDPOINT,
+    MAX_LEADERBOARD_PLAYERS,
+    PLAYER_ENDPOINT,
+    PLAYER_LOOKUP_ENDPOINT,
+    PLAYER_PIMS_ENDPOINT,
+    PLAYER_POSITIONS_ENDPOINT,
+    PLAYER_STAT_ENDPOINT,
+    PLAYER_STATS_ENDPOINT,
+    PLAYERS_ENDPOINT,
+    ROSTER_ENDPOINT,
+    ROSTER_PLAYER_ENDPOINT,
+    ROSTER_PLAYER_STATES_ENDPOINT,
+    ROSTER_PLAYERS_ENDPOINT,
+    ROSTERS_ENDPOINT,
+    ROSTERS_SUMMARY_ENDPOINT,
+    SEASON_ENDPOINT,
+    SEASONS_ENDPOINT,
+    STANDINGS_URL,
+    TEAM_ENDPOINT,
+    TEAM_ROSTER_ENDPOINT,
+    TEAM_STAT_ENDPOINT,
+    TEAM_STATS_ENDPOINT,
+    TEAMS_ENDPOINT,
+    VENUE_ENDPOINT,
+    VENUES_ENDPOINT,
+)
+from .exceptions import (
+    CFLAPIConnectionError,
+    CFLAPIError,
+    CFLAPINotFoundError,
+    CFLAPITimeoutError,
+)
+from .logger import logger
+from .singleflight import AsyncSingleFlight
+from .standings import parse_standings
+from .streaming import json_stream_parser
+from .types import (
+    College,
+    Fixture,
+    LeagueLeaders,
+    LedgerTransaction,
+    Player,
+    PlayerLookup,
+    PlayerPosition,
+    PlayerStats,
+    Roster,
+    RosterPlayer,
+    RosterPlayerState,
+    RosterSummary,
+    Season,
+    Standings,
+    Team,
+    TeamStats,
+    Venue,
+)
+
+T = TypeVar("T")
+
+
+class AsyncCFLClient(BaseCFLClient):
+    """Async client for interacting with the CFL API."""
+
+    _singleflight_class = AsyncSingleFlight
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client used for API requests."""
+        return httpx.AsyncClient(**self._client_options())
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Cancel background refreshes and close HTTP client."""
+        with self._refresh_lock:
+            self._closed = True
+
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self.client.aclose()
+        logger.debug("Closed async HTTP client")
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        json_data: dict | None = None,
+        headers: dict | None = None,
+    ) -> httpx.Response:
+        """Send HTTP request, retrying transient failures per the retry policy.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            json_data: JSON request body
+            headers: Extra request headers
+
+        Returns:
+            HTTP response of the last attempt
+        """
+        started = time.monotonic()
+        retries = 0
+
+        while True:
+            if self.api_rate_limiter is not None:
+                await self.api_rate_limiter.acquire_async()
+
+            try:
+                response = await self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers=headers,
+                )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, retries, started, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, retries, started, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            retries += 1
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        json_data: dict | None = None,
+    ) -> dict:
+        """Send HTTP request to the API.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json_data: JSON request body
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            CFLAPIConnectionError: For connection failures
+            CFLAPITimeoutError: For request timeouts
+        """
+        url = self._url(endpoint)
+        logger.debug("%s %s", method, url)
+        key, validated = self._conditional(method, endpoint, params)
+
+        try:
+            response = await self._send(
+                method,
+                url,
+                params=params,
+                json_data=json_data,
+                headers=validated.headers() if validated else None,
+            )
+
+            return self._process_response(response, key, validated)
+
+        except httpx.ConnectError as e:
+            logger.error("Connection error: %s", e)
+            raise CFLAPIConnectionError(f"Failed to connect: {e}") from e
+
+        except httpx.TimeoutException as e:
+            logger.error("Request timed out: %s", e)
+            raise CFLAPITimeoutError(f"Request timed out: {e}") from e
+
+        except Exception as e:
+            logger.error("Request failed: %s", e)
+            raise
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+    ) -> dict:
+        """Send GET request to API, serving it from the cache when possible.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Response JSON data
+        """
+        key = self._request_key("GET", endpoint, params)
+        template = endpoint_template(endpoint)
+        self._raise_if_not_found(key)
+
+        try:
+            return await self._cached(
+                key,
+                template,
+                lambda: self._request("GET", endpoint, params=params),
+            )
+
+        except CFLAPINotFoundError as e:
+            self._remember_not_found(key, template, e)
+            raise
+
+    async def _cached(
+        self,
+        key: str,
+        template: str | None,
+        fetch: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Serve a request from the cache, falling back to fetch.
+
+        Fresh entries are returned directly. Entries inside the
+        stale-while-revalidate window are returned immediately while a
+        background task refreshes them, and entries inside the
+        stale-if-error window are returned if the upstream request fails.
+
+        Args:
+            key: Request key
+            template: Endpoint template used for the cache policy
+            fetch: Coroutine function performing the upstream request
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        entry = self._cache_get(key)
+        if entry is not None:
+            if entry.fresh:
+                return entry.value
+
+            if entry.stale_for(self.cache_policy.stale_while_revalidate):
+                self._revalidate(key, template, fetch)
+                return entry.value
+
+        try:
+            return await self._coalesced(key, lambda: self._fetch(key, template, fetch))
+
+        except STALE_IF_ERROR_EXCEPTIONS as e:
+            if self._serve_stale_on_error(entry, key, e):
+                return entry.value  # type: ignore
+
+            raise
+
+    async def _coalesced(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn, sharing it with concurrent identical calls when coalescing."""
+        if self._singleflight is None:
+            return await fn()
+
+        return await self._singleflight.do(key, fn)
+
+    async def _fetch(
+        self,
+        key: str,
+        template: str | None,
+        fetch: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Fetch a value from upstream and cache it."""
+        token = _RESPONSE_SIZE.set(None)
+        try:
+            value = await fetch()
+            size = _RESPONSE_SIZE.get()
+        finally:
+            _RESPONSE_SIZE.reset(token)
+
+        self._cache_set(key, template, value, size)
+
+        return value
+
+    def _revalidate(self, key: str, template: str | None, fetch: Callable) -> None:
+        """Refresh a stale cache entry in a background task."""
+        if not self._begin_refresh(key):
+            return
+
+        async def refresh():
+            try:
+                await self._coalesced(key, lambda: self._fetch(key, template, fetch))
+            except STALE_IF_ERROR_EXCEPTIONS + (CFLAPIError,) as e:
+                logger.warning("Background refresh of %s failed: %s", key, e)
+            finally:
+                self._end_refresh(key)
+
+        task = asyncio.ensure_future(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _paginated_get(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        limit: int = DEFAULT_LIMIT,
+        page: int = DEFAULT_PAGE,
+    ) -> list[dict]:
+        """Get one page from a paginated endpoint.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            limit: Items per page
+            page: Page number
+
+        Returns:
+            List of items from the requested page
+        """
+        results = await self._get(endpoint, self._page_params(params, limit, page))
+        return cast(list[dict], results)
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Iterate over every item of a paginated endpoint.
+
+        Pages are fetched lazily, one at a time, until a short or empty page
+        comes back, so memory stays bounded by page_size and callers can stop
+        early.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Yields:
+            Items in page order
+        """
+        page = start_page
+        fetched = 0
+
+        while max_pages is None or fetched < max_pages:
+            items = await self._paginated_get(
+                endpoint, dict(params or {}), limit=page_size, page=page
+            )
+            for item in items:
+                yield item
+
+            if len(items) < page_size:
+                return
+
+            page += 1
+            fetched += 1
+
+    async def _fetch_all_pages(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[dict]:
+        """Fetch every page of a paginated endpoint concurrently.
+
+        The total is not exposed by the API, so up to ``concurrency`` pages
+        are kept in flight ahead of the page being consumed, until a short or
+        empty page marks the end.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        self._check_concurrency(concurrency)
+
+        def fetch(page: int) -> asyncio.Task:
+            return asyncio.ensure_future(
+                self._paginated_get(
+                    endpoint, dict(params or {}), limit=page_size, page=page
+                )
+            )
+
+        collector = _PageCollector()
+        next_page = DEFAULT_PAGE
+        pending: deque[asyncio.Task] = deque()
+
+        try:
+            for _ in range(concurrency):
+                pending.append(fetch(next_page))
+                next_page += 1
+
+            while pending:
+                items = await pending.popleft()
+                collector.add(items)
+
+                if len(items) < page_size:
+                    break
+
+                pending.append(fetch(next_page))
+                next_page += 1
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+            # Retrieve outcomes of pages fetched past the end
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return collector.items
+
+    async def _stream(
+        self, endpoint: str, params: dict | None = None
+    ) -> AsyncIterator[dict]:
+        """Stream the items of a JSON array response as they are parsed.
+
+        The body is parsed incrementally from the response bytes, so memory
+        stays bounded by one item. Streamed requests are rate limited but
+        bypass the cache, coalescing, conditional requests and retries.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Yields:
+            Items of the response array
+
+        Raises:
+            CFLAPIConnectionError: For connection failures
+            CFLAPITimeoutError: For request timeouts
+        """
+        url = self._url(endpoint)
+        logger.debug("GET %s (streaming)", url)
+
+        if self.api_rate_limiter is not None:
+            await self.api_rate_limiter.acquire_async()
+
+        try:
+            async with self.client.stream("GET", url, params=params) as response:
+                if response.is_error:
+                    await response.aread()
+                    self._handle_response(response)
+
+                template = endpoint_template(endpoint)
+                parser = json_stream_parser()
+                async for chunk in response.aiter_bytes():
+                    for item in parser.feed(chunk):
+                        yield self._stream_item(item, template)
+                for item in parser.close():
+                    yield self._stream_item(item, template)
+
+        except httpx.ConnectError as e:
+            logger.error("Connection error: %s", e)
+            raise CFLAPIConnectionError(f"Failed to connect: {e}") from e
+
+        except httpx.TimeoutException as e:
+            logger.error("Request timed out: %s", e)
+            raise CFLAPITimeoutError(f"Request timed out: {e}") from e
+
+    async def prefetch_relations(
+        self,
+        items: list[T],
+        relations: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[T]:
+        """Embed related entities on listing results, fetching each one once.
+
+        Distinct foreign keys (venue_id, season_id, player_id, college_id) are
+        gathered from items and fetched concurrently, so a season schedule with
+        venues costs one request per unique venue rather than one per game.
+
+        Args:
+            items: Entities from a listing (e.g. get_fixtures)
+            relations: Relations to embed: "venue", "season", "player", "college"
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Copies of items with related entities under relations; entities
+            that could not be fetched are left out
+
+        Raises:
+            ValueError: If a relation name is unknown
+        """
+        names = tuple(relations)
+        fetchers = {
+            "venue": self.get_venue,
+            "season": self.get_season,
+            "player": self.get_player,
+            "college": self.get_college,
+        }
+
+        batch = await fetch_batch_async(
+            self._relation_keys(items, names),
+            lambda key: fetchers[key[0]](key[1]),
+            concurrency,
+        )
+        if batch.errors:
+            logger.warning("Failed to prefetch %d related entities", len(batch.errors))
+
+        return cast(list[T], self._attach_relations(items, names, batch.results))
+
+    async def get_teams(
+        self,
+    ) -> list[Team]:
+        """Get all CFL teams.
+
+        Returns:
+            List of teams
+        """
+        results = await self._get(TEAMS_ENDPOINT)
+        return cast(list[Team], results)
+
+    async def get_team(self, team_id: int) -> Team:
+        """Get team details by ID.
+
+        Args:
+            team_id: Team ID
+
+        Returns:
+            Team details
+        """
+        endpoint = TEAM_ENDPOINT.format(team_id=team_id)
+        results = await self._get(endpoint)
+        return cast(Team, results)
+
+    async def get_team_roster(self, team_id: int) -> Roster:
+        """Get the current roster for a team including all roster players.
+
+        Args:
+            team_id: Team ID
+
+        Returns:
+            Roster with nested rosterplayers list
+        """
+        endpoint = TEAM_ROSTER_ENDPOINT.format(team_id=team_id)
+        results = await self._get(endpoint)
+        return cast(Roster, results)
+
+    async def get_venues(
+        self,
+    ) -> list[Venue]:
+        """Get all CFL venues.
+
+        Returns:
+            List of venues
+        """
+        results = await self._paginated_get(VENUES_ENDPOINT)
+        return cast(list[Venue], results)
+
+    async def get_venue(self, venue_id: int) -> Venue:
+        """Get venue details by ID.
+
+        Args:
+            venue_id: Venue ID
+
+        Returns:
+            Venue details
+        """
+        endpoint = VENUE_ENDPOINT.format(venue_id=venue_id)
+        results = await self._get(endpoint)
+        return cast(Venue, results)
+
+    def iter_venues(
+        self,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[Venue]:
+        """Iterate over all CFL venues, fetching pages on demand.
+
+        Args:
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Async iterator yielding one venue at a time
+        """
+        items = self._iter_pages(
+            VENUES_ENDPOINT, None, page_size, start_page, max_pages
+        )
+        return cast(AsyncIterator[Venue], items)
+
+    async def get_players(
+        self,
+        position: str | None = None,
+        college_id: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page: int = DEFAULT_PAGE,
+        limit: int = DEFAULT_LIMIT,
+    ) -> list[Player]:
+        """Get CFL players with optional filters.
+
+        Args:
+            position: Position code filter (e.g. "QB", "RB", "DB")
+            college_id: Filter by college ID
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page: Page number
+            limit: Items per page
+
+        Returns:
+            List of players
+        """
+        params = self._players_params(position, college_id, sort_by, sort_order)
+
+        results = await self._paginated_get(
+            PLAYERS_ENDPOINT, params=params, limit=limit, page=page
+        )
+        return cast(list[Player], results)
+
+    async def get_player(self, player_id: int, with_college: bool = False) -> Player:
+        """Get player details by ID.
+
+        Args:
+            player_id: Player ID
+            with_college: Embed college object under relations.college
+
+        Returns:
+            Player details
+        """
+        endpoint = PLAYER_ENDPOINT.format(player_id=player_id)
+        params = self._with_params(college=with_college)
+
+        results = await self._get(endpoint, params=params or None)
+        return cast(Player, results)
+
+    def iter_players(
+        self,
+        position: str | None = None,
+        college_id: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[Player]:
+        """Iterate over CFL players with optional filters, fetching pages on demand.
+
+        Args:
+            position: Position code filter (e.g. "QB", "RB", "DB")
+            college_id: Filter by college ID
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Async iterator yielding one player at a time
+        """
+        items = self._iter_pages(
+            PLAYERS_ENDPOINT,
+            self._players_params(position, college_id, sort_by, sort_order),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(AsyncIterator[Player], items)
+
+    async def get_all_players(
+        self,
+        position: str | None = None,
+        college_id: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[Player]:
+        """Get every page of players, fetching pages concurrently.
+
+        Args:
+            position: Position code filter (e.g. "QB", "RB", "DB")
+            college_id: Filter by college ID
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = await self._fetch_all_pages(
+            PLAYERS_ENDPOINT,
+            self._players_params(position, college_id, sort_by, sort_order),
+            page_size,
+            concurrency,
+        )
+        return cast(list[Player], results)
+
+    async def get_players_by_ids(
+        self,
+        player_ids: Iterable[int],
+        with_college: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BatchResult[int, Player]:
+        """Get details for many players concurrently.
+
+        Args:
+            player_ids: Player IDs; duplicates are fetched once
+            with_college: Embed college object under relations.college
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Players and per-ID API errors (e.g. 404s) keyed by player ID
+        """
+        return await fetch_batch_async(
+            player_ids,
+            lambda player_id: self.get_player(player_id, with_college=with_college),
+            concurrency,
+        )
+
+    async def search_players(self, pattern: str) -> list[PlayerLookup]:
+        """Search players by name pattern (regex supported).
+
+        Args:
+            pattern: Name pattern to search
+
+        Returns:
+            List of lightweight {ID, name} matches
+        """
+        endpoint = PLAYER_LOOKUP_ENDPOINT.format(pattern=pattern)
+        results = await self._get(endpoint)
+        return cast(list[PlayerLookup], results)
+
+    async def get_player_positions(self) -> list[PlayerPosition]:
+        """Get all player position definitions.
+
+        Returns:
+            List of position enums with squad grouping
+        """
+        results = await self._get(PLAYER_POSITIONS_ENDPOINT)
+        return cast(list[PlayerPosition], results)
+
+    async def get_seasons(
+        self, page: int = DEFAULT_PAGE, limit: int = DEFAULT_LIMIT
+    ) -> list[Season]:
+        """Get all seasons.
+
+        Args:
+            page: Page number
+            limit: Items per page
+
+        Returns:
+            List of seasons
+        """
+        results = await self._paginated_get(SEASONS_ENDPOINT, limit=limit, page=page)
+        return cast(list[Season], results)
+
+    async def get_season(self, season_id: int) -> Season:
+        """Get season details by ID.
+
+        Args:
+            season_id: Season ID
+
+        Returns:
+            Season details
+        """
+        endpoint = SEASON_ENDPOINT.format(season_id=season_id)
+        results = await self._get(endpoint)
+        return cast(Season, results)
+
+    def iter_seasons(
+        self,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[Season]:
+        """Iterate over all seasons, fetching pages on demand.
+
+        Args:
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Async iterator yielding one season at a time
+        """
+        items = self._iter_pages(
+            SEASONS_ENDPOINT, None, page_size, start_page, max_pages
+        )
+        return cast(AsyncIterator[Season], items)
+
+    async def get_fixtures(
+        self,
+        season_id: int | None = None,
+        home_team_id: int | None = None,
+        away_team_id: int | None = None,
+        venue_id: int | None = None,
+        page: int = DEFAULT_PAGE,
+        limit: int = DEFAULT_LIMIT,
+        with_venue: bool = False,
+        with_season: bool = False,
+    ) -> list[Fixture]:
+        """Get all fixtures (games).
+
+        Args:
+            season_id: Optional season filter
+            home_team_id: Filter by home team ID
+            away_team_id: Filter by away team ID
+            venue_id: Filter by venue ID
+            page: Page number
+            limit: Items per page
+            with_venue: Prefetch each distinct venue into relations.venue
+            with_season: Prefetch each distinct season into relations.season
+
+        Returns:
+            List of fixtures
+        """
+        endpoint, params = self._fixtures_request(
+            season_id, home_team_id, away_team_id, venue_id
+        )
+
+        results = await self._paginated_get(
+            endpoint, params=params, limit=limit, page=page
+        )
+        relations = self._relation_names(venue=with_venue, season=with_season)
+        if relations:
+            results = await self.prefetch_relations(results, relations)
+
+        return cast(list[Fixture], results)
+
+    async def get_fixture(
+        self,
+        fixture_id: int,
+        with_venue: bool = False,
+        with_season: bool = False,
+    ) -> Fixture:
+        """Get a single fixture (game) by ID.
+
+        Args:
+            fixture_id: Fixture ID
+            with_venue: Embed venue object under relations.venue
+            with_season: Embed season object under relations.season
+
+        Returns:
+            Fixture details
+        """
+        endpoint = FIXTURE_ENDPOINT.format(fixture_id=fixture_id)
+        params = self._with_params(venue=with_venue, season=with_season)
+
+        results = await self._get(endpoint, params=params or None)
+        return cast(Fixture, results)
+
+    def iter_fixtures(
+        self,
+        season_id: int | None = None,
+        home_team_id: int | None = None,
+        away_team_id: int | None = None,
+        venue_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[Fixture]:
+        """Iterate over fixtures (games), fetching pages on demand.
+
+        Args:
+            season_id: Optional season filter
+            home_team_id: Filter by home team ID
+            away_team_id: Filter by away team ID
+            venue_id: Filter by venue ID
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Async iterator yielding one fixture at a time
+        """
+        endpoint, params = self._fixtures_request(
+            season_id, home_team_id, away_team_id, venue_id
+        )
+        items = self._iter_pages(endpoint, params, page_size, start_page, max_pages)
+        return cast(AsyncIterator[Fixture], items)
+
+    async def get_all_fixtures(
+        self,
+        season_id: int | None = None,
+        home_team_id: int | None = None,
+        away_team_id: int | None = None,
+        venue_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        with_venue: bool = False,
+        with_season: bool = False,
+    ) -> list[Fixture]:
+        """Get every page of fixtures (games), fetching pages concurrently.
+
+        Args:
+            season_id: Optional season filter
+            home_team_id: Filter by home team ID
+            away_team_id: Filter by away team ID
+            venue_id: Filter by venue ID
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+            with_venue: Prefetch each distinct venue into relations.venue
+            with_season: Prefetch each distinct season into relations.season
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        endpoint, params = self._fixtures_request(
+            season_id, home_team_id, away_team_id, venue_id
+        )
+        results = await self._fetch_all_pages(endpoint, params, page_size, concurrency)
+        relations = self._relation_names(venue=with_venue, season=with_season)
+        if relations:
+            results = await self.prefetch_relations(results, relations, concurrency)
+
+        return cast(list[Fixture], results)
+
+    async def get_rosters(
+        self,
+    ) -> list[Roster]:
+        """Get all rosters.
+
+        Returns:
+            List of rosters
+        """
+
+        results = await self._get(ROSTERS_ENDPOINT)
+        return cast(list[Roster], results)
+
+    async def get_roster(self, roster_id: int) -> Roster:
+        """Get roster details by ID.
+
+        Args:
+            roster_id: Roster ID
+
+        Returns:
+            Roster details
+        """
+        endpoint = ROSTER_ENDPOINT.format(roster_id=roster_id)
+        results = await self._get(endpoint)
+        return cast(Roster, results)
+
+    async def get_rosters_summary(self) -> list[RosterSummary]:
+        """Get roster state and nationality counts for all teams.
+
+        Returns:
+            List of per-team roster summaries
+        """
+        results = await self._get(ROSTERS_SUMMARY_ENDPOINT)
+        return cast(list[RosterSummary], results)
+
+    async def get_roster_players(
+        self,
+        player_id: int | None = None,
+        with_player: bool = False,
+        page: int = DEFAULT_PAGE,
+        limit: int = DEFAULT_LIMIT,
+    ) -> list[RosterPlayer]:
+        """Get roster player entries with optional filters.
+
+        Args:
+            player_id: Filter to a specific player's roster entry
+            with_player: Embed full player object under relations.player
+            page: Page number
+            limit: Items per page
+
+        Returns:
+            List of roster player entries
+        """
+        params = self._roster_players_params(player_id, with_player)
+
+        results = await self._paginated_get(
+            ROSTER_PLAYERS_ENDPOINT, params=params, limit=limit, page=page
+        )
+        return cast(list[RosterPlayer], results)
+
+    async def get_roster_player(
+        self, rosterplayer_id: int, with_player: bool = False
+    ) -> RosterPlayer:
+        """Get a single roster player entry by ID.
+
+        Args:
+            rosterplayer_id: Roster player ID
+            with_player: Embed full player object under relations.player
+
+        Returns:
+            Roster player details
+        """
+        endpoint = ROSTER_PLAYER_ENDPOINT.format(rosterplayer_id=rosterplayer_id)
+        params = self._with_params(player=with_player)
+
+        results = await self._get(endpoint, params=params or None)
+        return cast(RosterPlayer, results)
+
+    def iter_roster_players(
+        self,
+        player_id: int | None = None,
+        with_player: bool = False,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[RosterPlayer]:
+        """Iterate over roster player entries, fetching pages on demand.
+
+        Args:
+            player_id: Filter to a specific player's roster entry
+            with_player: Embed full player object under relations.player
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Async iterator yielding one roster player entry at a time
+        """
+        items = self._iter_pages(
+            ROSTER_PLAYERS_ENDPOINT,
+            self._roster_players_params(player_id, with_player),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(AsyncIterator[RosterPlayer], items)
+
+    async def get_all_roster_players(
+        self,
+        player_id: int | None = None,
+        with_player: bool = False,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[RosterPlayer]:
+        """Get every page of roster player entries, fetching pages concurrently.
+
+        Args:
+            player_id: Filter to a specific player's roster entry
+            with_player: Embed full player object under relations.player
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = await self._fetch_all_pages(
+            ROSTER_PLAYERS_ENDPOINT,
+            self._roster_players_params(player_id, with_player),
+            page_size,
+            concurrency,
+        )
+        return cast(list[RosterPlayer], results)
+
+    async def get_roster_player_states(self) -> list[RosterPlayerState]:
+        """Get all valid roster player state definitions.
+
+        Returns:
+            List of state enums (game_roster, practice_roster, injured, etc.)
+        """
+        results = await self._get(ROSTER_PLAYER_STATES_ENDPOINT)
+        return cast(list[RosterPlayerState], results)
+
+    async def get_ledger(
+        self,
+        year: int,
+    ) -> list[LedgerTransaction]:
+        """Get player transactions.
+
+        Args:
+            year: Year to fetch (e.g., 2026)
+
+        Returns:
+            List of transactions
+        """
+        endpoint = LEDGER_ENDPOINT.format(year=year)
+        results = await self._get(endpoint)
+        return cast(list[LedgerTransaction], results)
+
+    async def get_colleges(
+        self,
+        name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page: int = DEFAULT_PAGE,
+        limit: int = DEFAULT_LIMIT,
+    ) -> list[College]:
+        """Get colleges with optional filters.
+
+        Args:
+            name: Filter by college name
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page: Page number
+            limit: Items per page
+
+        Returns:
+            List of colleges
+        """
+        params = self._colleges_params(name, sort_by, sort_order)
+
+        results = await self._paginated_get(
+            COLLEGES_ENDPOINT, params=params, limit=limit, page=page
+        )
+        return cast(list[College], results)
+
+    async def get_college(self, college_id: int) -> College:
+        """Get college details by ID.
+
+        Args:
+            college_id: College ID
+
+        Returns:
+            College details
+        """
+        endpoint = COLLEGE_ENDPOINT.format(college_id=college_id)
+        results = await self._get(endpoint)
+        return cast(College, results)
+
+    def iter_colleges(
+        self,
+        name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[College]:
+        """Iterate over colleges with optional filters, fetching pages on demand.
+
+        Args:
+            name: Filter by college name
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Async iterator yielding one college at a time
+        """
+        items = self._iter_pages(
+            COLLEGES_ENDPOINT,
+            self._colleges_params(name, sort_by, sort_order),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(AsyncIterator[College], items)
+
+    async def get_all_colleges(
+        self,
+        name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[College]:
+        """Get every page of colleges, fetching pages concurrently.
+
+        Args:
+            name: Filter by college name
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = await self._fetch_all_pages(
+            COLLEGES_ENDPOINT,
+            self._colleges_params(name, sort_by, sort_order),
+            page_size,
+            concurrency,
+        )
+        return cast(list[College], results)
+
+    async def get_team_stats(
+        self,
+        season_id: int | None = None,
+    ) -> list[TeamStats]:
+        """Get team statistics.
+
+        Args:
+            season_id: Optional season filter
+
+        Returns:
+            List of team statistics
+        """
+        params = self._season_params(season_id)
+
+        results = await self._get(TEAM_STATS_ENDPOINT, params=params)
+        return cast(list[TeamStats], results)
+
+    def stream_team_stats(
+        self,
+        season_id: int | None = None,
+    ) -> AsyncIterator[TeamStats]:
+        """Stream team statistics one record at a time.
+
+        Records are parsed incrementally from the response, so peak memory
+        stays constant however many fixtures each record carries. Responses
+        are not cached.
+
+        Args:
+            season_id: Optional season filter
+
+        Returns:
+            Iterator yielding one team stats record at a time
+        """
+        items = self._stream(TEAM_STATS_ENDPOINT, self._season_params(season_id))
+        return cast(AsyncIterator[TeamStats], items)
+
+    async def get_team_stat(
+        self, team_stats_id: int, season_id: int | None = None
+    ) -> TeamStats:
+        """Get team stats by ID.
+
+        Args:
+            team_stats_id: Team stats ID
+
+        Returns:
+            Team statistics
+        """
+        endpoint = TEAM_STAT_ENDPOINT.format(team_stats_id=team_stats_id)
+        params = self._season_params(season_id)
+
+        results = await self._get(endpoint, params=params)
+        return cast(TeamStats, results)
+
+    async def get_player_stats(
+        self,
+        season_id: int | None = None,
+        page: int = DEFAULT_PAGE,
+        limit: int = DEFAULT_LIMIT,
+    ) -> list[PlayerStats]:
+        """Get cumulative player statistics.
+
+        Args:
+            season_id: Optional season filter
+            page: Page number
+            limit: Items per page
+
+        Returns:
+            List of player statistics
+        """
+        params = self._season_params(season_id)
+
+        results = await self._paginated_get(
+            PLAYER_STATS_ENDPOINT, params=params, limit=limit, page=page
+        )
+        return cast(list[PlayerStats], results)
+
+    async def get_player_stat(self, player_stats_id: int) -> PlayerStats:
+        """Get player stats by Player stats ID.
+
+        Args:
+            player_stats_id: Player stats ID
+
+        Returns:
+            Player statistics
+        """
+        endpoint = PLAYER_STAT_ENDPOINT.format(player_stats_id=player_stats_id)
+        results = await self._get(endpoint)
+        return cast(PlayerStats, results)
+
+    def iter_player_stats(
+        self,
+        season_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> AsyncIterator[PlayerStats]:
+        """Iterate over cumulative player statistics, fetching pages on demand.
+
+        Args:
+            season_id: Optional season filter
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Async iterator yielding one player stats record at a time
+        """
+        items = self._iter_pages(
+            PLAYER_STATS_ENDPOINT,
+            self._season_params(season_id),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(AsyncIterator[PlayerStats], items)
+
+    async def get_all_player_stats(
+        self,
+        season_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[PlayerStats]:
+        """Get every page of cumulative player statistics, fetching pages concurrently.
+
+        Args:
+            season_id: Optional season filter
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = await self._fetch_all_pages(
+            PLAYER_STATS_ENDPOINT,
+            self._season_params(season_id),
+            page_size,
+            concurrency,
+        )
+        return cast(list[PlayerStats], results)
+
+    def stream_player_stats(
+        self,
+        season_id: int | None = None,
+        page: int = DEFAULT_PAGE,
+        limit: int = DEFAULT_LIMIT,
+    ) -> AsyncIterator[PlayerStats]:
+        """Stream one page of cumulative player statistics one record at a time.
+
+        Records are parsed incrementally from the response, so peak memory
+        stays constant however large limit is. Responses are not cached.
+
+        Args:
+            season_id: Optional season filter
+            page: Page number
+            limit: Items per page
+
+        Returns:
+            Iterator yielding one player stats record at a time
+        """
+        params = self._page_params(self._season_params(season_id), limit, page)
+
+        items = self._stream(PLAYER_STATS_ENDPOINT, params)
+        return cast(AsyncIterator[PlayerStats], items)
+
+    async def get_player_pims(self, player_id: int) -> PlayerStats:
+        """Get player stats by PIMS ID (player id).
+
+        Args:
+            player_id: Player ID
+
+        Returns:
+            Player statistics with photo URL
+        """
+        endpoint = PLAYER_PIMS_ENDPOINT.format(player_id=player_id)
+        results = await self._get(endpoint)
+
+        if results:
+            results["photo_url"] = self._pims_photo_url(player_id)
+
+        return cast(PlayerStats, results)
+
+    async def _web_get(self, url: str) -> httpx.Response:
+        """Fetch a cfl.ca page under the web rate limiter.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            HTTP response
+        """
+        if self.web_rate_limiter is not None:
+            await self.web_rate_limiter.acquire_async()
+
+        return await self.client.get(url, headers=self.headers)
+
+    async def get_player_stats_by_ids(
+        self,
+        player_ids: Iterable[int],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BatchResult[int, PlayerStats]:
+        """Get player stats by PIMS ID for many players concurrently.
+
+        Args:
+            player_ids: Player IDs; duplicates are fetched once
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Player statistics and per-ID API errors (e.g. 404s) keyed by player ID
+        """
+        return await fetch_batch_async(player_ids, self.get_player_pims, concurrency)
+
+    async def get_standings(
+        self, year: int = DEFAULT_SEASON, strict: bool = False
+    ) -> Standings:
+        """Get Standings data of a season
+
+        Args:
+            year: Season year (valid options: 2023-2026)
+            strict: Raise on a failed page instead of returning empty data
+
+        Returns:
+            Dictionary containing standings data by division
+        """
+        url = self._standings_url(year)
+
+        async def fetch() -> Standings:
+            response = await self._web_get(url)
+            response.raise_for_status()
+
+            return await self._parse_page_async(url, response.text, parse_standings)
+
+        try:
+            return await self._cached(
+                self._request_key("GET", url), STANDINGS_URL, fetch
+            )
+
+        except (httpx.HTTPStatusError, httpx.RequestError, Exception):
+            if strict:
+                raise
+
+            return {"WEST": [], "EAST": []}
+
+    async def get_leaderboards(
+        self, season: int = DEFAULT_SEASON, strict: bool = False
+    ) -> LeagueLeaders:
+        """Get league leaders for all categories
+
+        Args:
+            season: Season year (valid options: 2023-2026)
+            strict: Raise on a failed page instead of leaving its category empty
+        """
+        self._check_leaderboard_season(season)
+
+        tasks = [
+            self._web_get(self._leaderboard_url(category, season))
+            for category in LEADERBOARD_CATEGORIES
+        ]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+        return await self._parse_leaderboards(responses, strict=strict)
+
+    async def get_leaderboards_by_season(
+        self,
+        seasons: Iterable[int] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_players: int = MAX_LEADERBOARD_PLAYERS,
+    ) -> dict[int, LeagueLeaders]:
+        """Get league leaders of many seasons in one concurrent call.
+
+        Every (season, category) page is fetched over the client's connection
+        pool, and pages are parsed in the parse executor as they arrive.
+
+        Args:
+            seasons: Seasons to fetch (None for every supported season)
+            concurrency: Maximum page requests in flight
+            max_players: Players kept per stat table
+
+        Returns:
+            League leaders keyed by season
+
+        Raises:
+            ValueError: If any season is outside the supported range
+        """
+        return await self._leaderboards_by_season(
+            self._web_get,
+            self._leaderboard_seasons(seasons),
+            concurrency,
+            max_players,
+        )
@@ -0,0 +1,964 @@
+"""Shared request building and response handling for the CFL API clients."""
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from typing import Any, cast
+from urllib.parse import urlencode, urljoin
+
+import httpx
+
+from .cache import (
+    CacheBackend,
+    CacheEntry,
+    CachePolicy,
+    MemoryCache,
+    endpoint_template,
+)
+from .conditional import Validated, ValidatorStore
+from .constants import (
+    BASE_API_URL,
+    DEFAULT_HEADERS,
+    DEFAULT_HTTP2,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_TIMEOUT,
+    DEFENCE,
+    FIXTURES_ENDPOINT,
+    LEADERBOARD_CATEGORIES,
+    LEADERBOARD_URL,
+    MAX_CONDITIONAL_BYTES,
+    MAX_CONDITIONAL_ENTRIES,
+    MAX_LEADERBOARD_PLAYERS,
+    MAX_NEGATIVE_CACHE_ENTRIES,
+    MAX_PARSED_PAGE_ENTRIES,
+    MAX_SEASON,
+    MIN_SEASON,
+    OFFENCE,
+    RELATION_FOREIGN_KEYS,
+    SEASON_FIXTURES_ENDPOINT,
+    SPECIAL_TEAMS,
+    STANDINGS_URL,
+    get_random_user_agent,
+)
+from .decoding import JSONDecoder, get_json_decoder
+from .exceptions import (
+    CFLAPIAuthenticationError,
+    CFLAPIConnectionError,
+    CFLAPINotFoundError,
+    CFLAPIServerError,
+    CFLAPITimeoutError,
+    CFLAPIValidationError,
+)
+from .html_parsing import ParsedPageStore
+from .leaderboard import parse_leaderboard_category
+from .logger import logger
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .types import LeagueLeaders
+
+# Raw byte size of the last response decoded in the current thread or task,
+# read back when caching so MemoryCache need not re-encode the value to size it
+_RESPONSE_SIZE: ContextVar[int | None] = ContextVar("_RESPONSE_SIZE", default=None)
+
+# Upstream failures that may be answered from a stale cache entry
+STALE_IF_ERROR_EXCEPTIONS = (
+    CFLAPIServerError,
+    CFLAPIConnectionError,
+    CFLAPITimeoutError,
+    httpx.HTTPError,
+)
+
+
+class _PageCollector:
+    """Accumulate pages in order, dropping items whose ID was already seen."""
+
+    def __init__(self):
+        self.items: list[dict] = []
+        self._seen: set = set()
+
+    def add(self, page: list[dict]) -> None:
+        for item in page:
+            item_id = item.get("ID") if hasattr(item, "get") else None
+            if item_id is not None:
+                if item_id in self._seen:
+                    continue
+
+                self._seen.add(item_id)
+
+            self.items.append(item)
+
+
+class BaseCFLClient(ABC):
+    """Configuration, URL building and error mapping shared by the sync and async clients."""
+
+    _singleflight_class: type = SingleFlight
+
+    def __init__(
+        self,
+        base_url: str = BASE_API_URL,
+        timeout: int = DEFAULT_TIMEOUT,
+        http2: bool = DEFAULT_HTTP2,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        headers: dict[str, str] | None = None,
+        retry: RetryPolicy | None = None,
+        api_rate_limiter: TokenBucket | None = None,
+        web_rate_limiter: TokenBucket | None = None,
+        coalesce: bool = False,
+        conditional_requests: bool = False,
+        cache: CacheBackend | None = None,
+        cache_policy: CachePolicy | None = None,
+        negative_cache_ttl: float | None = None,
+        json_decoder: str | JSONDecoder | None = None,
+        structs: bool = False,
+        parse_executor: Executor | None = None,
+        reuse_parsed_pages: bool = False,
+    ):
+        """Initialize CFL API client.
+
+        Args:
+            base_url: API base URL
+            timeout: Request timeout in seconds
+            http2: Negotiate HTTP/2 so concurrent requests share one connection
+            max_connections: Maximum open connections in the pool (None for no limit)
+            max_keepalive_connections: Maximum idle connections kept alive (None for no limit)
+            keepalive_expiry: Seconds an idle connection is kept before closing
+            headers: Extra default headers, merged over the built-in Referer/User-Agent
+            retry: Retry policy for transient failures (None disables retries)
+            api_rate_limiter: Token bucket throttling JSON API requests
+            web_rate_limiter: Token bucket throttling cfl.ca standings/leaderboard scrapes
+            coalesce: Share one upstream call between concurrent identical GETs.
+                Coalesced callers receive the same object, so treat it as read-only
+            conditional_requests: Revalidate GETs with If-None-Match/If-Modified-Since
+                and reuse the previously decoded body on 304 Not Modified
+            cache: Response cache backend (None disables caching). Cached values
+                are shared between callers, so treat them as read-only
+            cache_policy: Per-endpoint TTLs used when caching responses
+            negative_cache_ttl: Seconds to remember 404 responses and raise
+                CFLAPINotFoundError without a network round trip (None disables)
+            json_decoder: "orjson", "msgspec", "json" or a callable decoding response
+                bytes (None picks the fastest installed backend)
+            structs: Decode responses into the validated msgspec Structs of
+                cfl.structs instead of dicts (requires msgspec)
+            parse_executor: Executor that parses scraped cfl.ca pages off the event
+                loop (None uses the loop's default thread pool). Pass a
+                ProcessPoolExecutor to parse leaderboard categories in parallel
+                across cores
+            reuse_parsed_pages: Skip re-parsing standings and leaderboard pages whose
+                tables hash the same as the last parse of that URL, returning the
+                previous result. Reused results are shared, so treat them as read-only
+        """
+
+        self.base_url = base_url
+        self.timeout = timeout
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.headers = {
+            **DEFAULT_HEADERS,
+            "User-Agent": get_random_user_agent(),
+            **(headers or {}),
+        }
+        self.retry = retry
+        self.api_rate_limiter = api_rate_limiter
+        self.web_rate_limiter = web_rate_limiter
+        self._singleflight = self._singleflight_class() if coalesce else None
+        self._validators = (
+            ValidatorStore(MAX_CONDITIONAL_ENTRIES, MAX_CONDITIONAL_BYTES)
+            if conditional_requests
+            else None
+        )
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
+        self.negative_cache_ttl = negative_cache_ttl
+        self._not_found = (
+            MemoryCache(max_entries=MAX_NEGATIVE_CACHE_ENTRIES)
+            if negative_cache_ttl
+            else None
+        )
+        self.json_decoder = get_json_decoder(json_decoder)
+        self._structs = None
+        if structs:
+            # Imported lazily because cfl.structs requires the optional msgspec
+            from .structs import (  # pylint: disable=import-outside-toplevel
+                StructDecoder,
+            )
+
+            self._structs = StructDecoder()
+        self.parse_executor = parse_executor
+        self.parsed_pages = (
+            ParsedPageStore(MAX_PARSED_PAGE_ENTRIES) if reuse_parsed_pages else None
+        )
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._background_tasks: set = set()
+        self._closed = False
+        self.client = self._create_client()
+
+    @abstractmethod
+    def _create_client(self):
+        """Create the pooled HTTP client used for API requests."""
+
+    def _client_options(self) -> dict:
+        """Build keyword arguments for the underlying httpx clients.
+
+        Returns:
+            Timeout, default headers, HTTP/2 and pool limit options
+        """
+
+        return {
+            "timeout": self.timeout,
+            "headers": self.headers,
+            "http2": self.http2,
+            "limits": self.limits,
+        }
+
+    def _url(self, endpoint: str) -> str:
+        """Build full URL from endpoint.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            Complete URL
+        """
+
+        return urljoin(self.base_url, f"/api/{endpoint.lstrip('/')}")
+
+    def _request_key(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+    ) -> str:
+        """Build a normalized key identifying a request.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint, or an absolute URL for web pages
+            params: Query parameters
+
+        Returns:
+            Method, URL and sorted query string
+        """
+        if endpoint.startswith(("http://", "https://")):
+            url = endpoint
+        else:
+            url = self._url(endpoint)
+
+        query = sorted(
+            (str(key), str(value))
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+
+        return f"{method.upper()} {url}?{urlencode(query)}"
+
+    def _cache_get(self, key: str) -> CacheEntry | None:
+        """Look up a cached response.
+
+        Args:
+            key: Request key
+
+        Returns:
+            Cache entry (possibly stale), or None on a miss or when caching is disabled
+        """
+        if self.cache is None:
+            return None
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            logger.debug("Cache hit: %s", key)
+
+            if self._structs is not None:
+                entry = entry._replace(
+                    value=self._structs.convert(entry.value, entry.tag)
+                )
+
+        return entry
+
+    def _cache_set(
+        self, key: str, template: str | None, value, size: int | None = None
+    ) -> None:
+        """Cache a response according to the endpoint's TTL.
+
+        Args:
+            key: Request key
+            template: Endpoint template or page URL template the response came from
+            value: Decoded response
+            size: Raw byte size of the response, when known
+        """
+        if self.cache is None:
+            return
+
+        ttl = self.cache_policy.ttl(template)
+        if ttl:
+            self.cache.set(
+                key,
+                value,
+                ttl,
+                tag=template,
+                stale_ttl=self.cache_policy.stale_ttl,
+                size=size,
+            )
+
+    def _raise_if_not_found(self, key: str) -> None:
+        """Raise a remembered 404 for a request key.
+
+        Raises:
+            CFLAPINotFoundError: If the request returned 404 within negative_cache_ttl
+        """
+        if self._not_found is None:
+            return
+
+        entry = self._not_found.get(key)
+        if entry is not None:
+            logger.debug("Negative cache hit: %s", key)
+            raise CFLAPINotFoundError(entry.value)
+
+    def _remember_not_found(
+        self,
+        key: str,
+        template: str | None,
+        error: CFLAPINotFoundError,
+    ) -> None:
+        """Remember a 404 so repeated lookups fail fast."""
+        if self._not_found is not None and self.negative_cache_ttl:
+            self._not_found.set(
+                key, error.message, self.negative_cache_ttl, tag=template
+            )
+
+    def _serve_stale_on_error(
+        self,
+        entry: CacheEntry | None,
+        key: str,
+        error: Exception,
+    ) -> bool:
+        """Check whether a failed request may be answered with a stale entry.
+
+        Args:
+            entry: Cache entry found before the request, if any
+            key: Request key
+            error: Upstream failure
+
+        Returns:
+            True if the stale entry is within the stale-if-error window
+        """
+        if entry is None or not entry.stale_for(self.cache_policy.stale_if_error):
+            return False
+
+        logger.warning("Serving stale %s after upstream error: %s", key, error)
+
+        return True
+
+    def _begin_refresh(self, key: str) -> bool:
+        """Claim a background refresh for a key.
+
+        Returns:
+            False if a refresh for the key is already running or the client
+            is closed
+        """
+        with self._refresh_lock:
+            if self._closed or key in self._refreshing:
+                return False
+
+            self._refreshing.add(key)
+
+            return True
+
+    def _end_refresh(self, key: str) -> None:
+        """Release a background refresh claimed with _begin_refresh."""
+        with self._refresh_lock:
+            self._refreshing.discard(key)
+
+    def invalidate_cache(
+        self,
+        endpoint: str | None = None,
+        params: dict | None = None,
+    ) -> None:
+        """Remove cached responses and remembered 404s.
+
+        Args:
+            endpoint: Endpoint template (e.g. TEAMS_ENDPOINT) to drop every
+                cached response of that endpoint, or a formatted endpoint
+                (e.g. "/seasons/35/fixtures") to drop that path. None clears
+                the whole cache.
+            params: With a formatted endpoint, drop only the response for
+                exactly these query parameters
+        """
+        for cache in (self.cache, self._not_found):
+            if cache is None:
+                continue
+
+            if endpoint is None:
+                cache.clear()
+            elif "{" in endpoint:
+                cache.invalidate_tag(endpoint)
+            elif params is not None:
+                cache.delete(self._request_key("GET", endpoint, params))
+            else:
+                cache.invalidate_prefix(self._request_key("GET", endpoint))
+
+    def _response_template(self, response: httpx.Response) -> str | None:
+        """Find the endpoint template of an API response from its URL."""
+        path = response.url.path
+        base_path = httpx.URL(self.base_url).path.rstrip("/")
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path) :]
+
+        return endpoint_template(path)
+
+    def _stream_item(self, item: dict, template: str | None):
+        """Convert a streamed array element like _handle_response would."""
+        if self._structs is None:
+            return item
+
+        return self._structs.convert_item(item, template)
+
+    def _handle_response(self, response: httpx.Response) -> dict:
+        """Process API response and handle errors.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            CFLAPIResponseError: For API errors
+        """
+        logger.debug("Response status: %s", response.status_code)
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+
+            try:
+                error_data = self.json_decoder(e.response.content)
+                message = error_data.get("message", str(e))
+            except (ValueError, KeyError):
+                message = str(e)
+
+            if status_code == 404:
+                raise CFLAPINotFoundError(message) from e
+            elif status_code in (401, 403):
+                raise CFLAPIAuthenticationError(status_code, message) from e
+            elif status_code == 400:
+                raise CFLAPIValidationError(message) from e
+            elif status_code >= 500:
+                raise CFLAPIServerError(status_code, message) from e
+            else:
+                raise CFLAPIValidationError(message) from e
+
+        try:
+            if self._structs is not None:
+                return self._structs.decode(response, self._response_template(response))
+
+            return self.json_decoder(response.content)
+
+        except ValueError:
+            logger.warning("Failed to decode JSON response")
+
+            return {}
+
+    def _retry_delay(
+        self,
+        method: str,
+        retries: int,
+        started: float,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Ask the retry policy how long to wait before the next attempt.
+
+        Args:
+            method: HTTP method
+            retries: Number of retries already performed
+            started: Monotonic time of the first attempt
+            response: Response of the failed attempt, if any
+            error: Transport exception of the failed attempt, if any
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if self.retry is None:
+            return None
+
+        delay = self.retry.next_delay(
+            method,
+            retries,
+            time.monotonic() - started,
+            response=response,
+            error=error,
+        )
+        if delay is not None:
+            reason = response.status_code if response is not None else repr(error)
+            logger.warning(
+                "Retrying %s in %.2fs (attempt %d, reason: %s)",
+                method,
+                delay,
+                retries + 2,
+                reason,
+            )
+
+        return delay
+
+    def _conditional(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+    ) -> tuple[str | None, Validated | None]:
+        """Look up stored validators for a conditional GET.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Request key (None when conditional requests do not apply) and
+            the validators of the last response, if any
+        """
+        if self._validators is None or method.upper() != "GET":
+            return None, None
+
+        key = self._request_key(method, endpoint, params)
+
+        return key, self._validators.get(key)
+
+    def _process_response(
+        self,
+        response: httpx.Response,
+        key: str | None = None,
+        validated: Validated | None = None,
+    ) -> dict:
+        """Handle a response, resolving 304 Not Modified from stored validators.
+
+        Args:
+            response: HTTP response
+            key: Request key used to store validators
+            validated: Validators sent with the request
+
+        Returns:
+            Response JSON data
+        """
+        if validated is not None and response.status_code == 304:
+            logger.debug("Not modified, reusing previous body")
+            _RESPONSE_SIZE.set(validated.size)
+            return validated.body
+
+        results = self._handle_response(response)
+        _RESPONSE_SIZE.set(len(response.content))
+        if key is not None and self._validators is not None:
+            self._validators.store(key, response, results)
+
+        return results
+
+    @staticmethod
+    def _check_concurrency(concurrency: int) -> None:
+        """Validate the number of requests kept in flight.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+    @staticmethod
+    def _page_params(
+        params: dict | None,
+        limit: int,
+        page: int,
+    ) -> dict:
+        """Add pagination to query parameters.
+
+        Args:
+            params: Additional query parameters
+            limit: Items per page
+            page: Page number
+
+        Returns:
+            Query parameters including limit and page
+        """
+        params = params or {}
+        params["limit"] = limit
+        params["page"] = page
+
+        return params
+
+    @staticmethod
+    def _with_params(**relations: bool) -> dict:
+        """Build the ``with`` parameter used to embed related objects.
+
+        Args:
+            relations: Relation names mapped to whether they should be embedded
+
+        Returns:
+            Query parameters, empty when nothing is embedded
+        """
+        with_values = [name for name, enabled in relations.items() if enabled]
+        if not with_values:
+            return {}
+
+        return {"with": ",".join(with_values)}
+
+    @staticmethod
+    def _relation_names(**relations: bool) -> list[str]:
+        """Get the relation names enabled by with_* flags."""
+        return [name for name, enabled in relations.items() if enabled]
+
+    @staticmethod
+    def _relation_keys(items: list, relations: tuple[str, ...]) -> list[tuple]:
+        """Collect the (relation, foreign key) pairs referenced by items.
+
+        Args:
+            items: Entities carrying foreign key fields (e.g. fixtures)
+            relations: Relation names from RELATION_FOREIGN_KEYS
+
+        Returns:
+            Pairs to fetch, in first-seen order with duplicates removed
+
+        Raises:
+            ValueError: If a relation name is unknown
+        """
+        unknown = [name for name in relations if name not in RELATION_FOREIGN_KEYS]
+        if unknown:
+            raise ValueError(
+                f"Unknown relations {unknown}. "
+                f"Valid options: {list(RELATION_FOREIGN_KEYS)}"
+            )
+
+        keys = {}
+        for item in items:
+            for name in relations:
+                foreign_key = item.get(RELATION_FOREIGN_KEYS[name])
+                if foreign_key is not None:
+                    keys[(name, foreign_key)] = None
+
+        return list(keys)
+
+    @staticmethod
+    def _attach_relations(
+        items: list, relations: tuple[str, ...], entities: dict[tuple, dict]
+    ) -> list:
+        """Embed fetched entities under each item's relations.
+
+        Items are copied rather than modified, since they may be shared with
+        the response cache.
+
+        Args:
+            items: Entities carrying foreign key fields
+            relations: Relation names from RELATION_FOREIGN_KEYS
+            entities: Fetched entities keyed by (relation, foreign key)
+
+        Returns:
+            Copies of items with the found entities attached
+        """
+        attached = []
+        for item in items:
+            found = {}
+            for name in relations:
+                key = (name, item.get(RELATION_FOREIGN_KEYS[name]))
+                if key in entities:
+                    found[name] = entities[key]
+
+            if isinstance(item, dict):
+                embedded = {**(item.get("relations") or {}), **found}
+                attached.append({**item, "relations": embedded})
+            else:
+                # Structs from structs=True are rebuilt as Structs
+                attached.append(item.with_relations(found))
+
+        return attached
+
+    @staticmethod
+    def _players_params(
+        position: str | None = None,
+        college_id: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+    ) -> dict:
+        """Build query parameters for the players listing."""
+        params: dict = {}
+        if position:
+            params["position"] = position
+        if college_id:
+            params["college_id"] = college_id
+        if sort_by:
+            params["sort_by"] = sort_by
+        if sort_order:
+            params["sort_order"] = sort_order
+
+        return params
+
+    @staticmethod
+    def _fixtures_request(
+        season_id: int | None = None,
+        home_team_id: int | None = None,
+        away_team_id: int | None = None,
+        venue_id: int | None = None,
+    ) -> tuple[str, dict]:
+        """Build endpoint and query parameters for the fixtures listing."""
+        params: dict = {}
+        if home_team_id:
+            params["home_team_id"] = home_team_id
+        if away_team_id:
+            params["away_team_id"] = away_team_id
+        if venue_id:
+            params["venue_id"] = venue_id
+
+        if season_id:
+            endpoint = SEASON_FIXTURES_ENDPOINT.format(season_id=season_id)
+        else:
+            endpoint = FIXTURES_ENDPOINT
+
+        return endpoint, params
+
+    @staticmethod
+    def _roster_players_params(
+        player_id: int | None = None,
+        with_player: bool = False,
+    ) -> dict:
+        """Build query parameters for the roster players listing."""
+        params: dict = {}
+        if player_id:
+            params["player_id"] = player_id
+        if with_player:
+            params["with"] = "player"
+
+        return params
+
+    @staticmethod
+    def _colleges_params(
+        name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+    ) -> dict:
+        """Build query parameters for the colleges listing."""
+        params: dict = {}
+        if name:
+            params["name"] = name
+        if sort_by:
+            params["sort_by"] = sort_by
+        if sort_order:
+            params["sort_order"] = sort_order
+
+        return params
+
+    @staticmethod
+    def _season_params(season_id: int | None = None) -> dict:
+        """Build the optional season filter used by the stats endpoints."""
+        params: dict = {}
+        if season_id:
+            params["season_id"] = season_id
+
+        return params
+
+    @staticmethod
+    def _pims_photo_url(player_id: int | str) -> str:
+        """Build the static photo URL for a PIMS player ID."""
+        return f"https://static.cfl.ca/wp-content/uploads/{player_id}.png"
+
+    @staticmethod
+    def _standings_url(year: int) -> str:
+        """Build the cfl.ca standings URL for a season.
+
+        Raises:
+            ValueError: If the year is outside the supported range
+        """
+        if year < MIN_SEASON or year > MAX_SEASON:
+            raise ValueError(f"Year must be between {MIN_SEASON} and {MAX_SEASON}")
+
+        return STANDINGS_URL.format(year=year)
+
+    @staticmethod
+    def _leaderboard_url(category: str, season: int) -> str:
+        """Build the cfl.ca league leaders URL for a category and season."""
+        return f"{LEADERBOARD_URL}?stat_category={category}&season={season}"
+
+    @staticmethod
+    def _check_leaderboard_season(season: int) -> None:
+        """Validate a leaderboard season.
+
+        Raises:
+            ValueError: If the season is outside the supported range
+        """
+        if season < MIN_SEASON or season > MAX_SEASON:
+            raise ValueError(f"Season must be between {MIN_SEASON} and {MAX_SEASON}")
+
+    @classmethod
+    def _leaderboard_seasons(cls, seasons: Iterable[int] | None) -> list[int]:
+        """Resolve the seasons of a multi-season leaderboard request.
+
+        Args:
+            seasons: Seasons to fetch (None for every supported season)
+
+        Returns:
+            Unique seasons in request order
+
+        Raises:
+            ValueError: If any season is outside the supported range
+        """
+        if seasons is None:
+            return list(range(MIN_SEASON, MAX_SEASON + 1))
+
+        resolved = list(dict.fromkeys(seasons))
+        for season in resolved:
+            cls._check_leaderboard_season(season)
+
+        return resolved
+
+    async def _parse_off_loop(self, parse: Callable[..., Any], *args: Any) -> Any:
+        """Run a CPU-bound page parser in the parse executor.
+
+        Keeps the event loop free for other requests while BeautifulSoup runs.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.parse_executor, parse, *args)
+
+    def _parse_page(
+        self, key: Hashable, html_content: str, parse: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Parse a scraped page, reusing the last result if its tables are unchanged.
+
+        Args:
+            key: Request key the page was fetched with
+            html_content: Page HTML
+            parse: Parser taking the HTML and ``args``
+            *args: Extra parser arguments
+
+        Returns:
+            Parsed page
+        """
+        store = self.parsed_pages
+        if store is None:
+            return parse(html_content, *args)
+
+        digest = store.digest(html_content)
+        parsed = store.get(key, digest)
+        if parsed is None:
+            parsed = parse(html_content, *args)
+            store.store(key, digest, parsed)
+
+        return parsed
+
+    async def _parse_page_async(
+        self, key: Hashable, html_content: str, parse: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Parse a scraped page off the event loop, reusing unchanged results.
+
+        See _parse_page.
+        """
+        store = self.parsed_pages
+        if store is None:
+            return await self._parse_off_loop(parse, html_content, *args)
+
+        digest = store.digest(html_content)
+        parsed = store.get(key, digest)
+        if parsed is None:
+            parsed = await self._parse_off_loop(parse, html_content, *args)
+            store.store(key, digest, parsed)
+
+        return parsed
+
+    async def _parse_leaderboards(
+        self,
+        responses: Sequence[Any],
+        max_players: int = MAX_LEADERBOARD_PLAYERS,
+        strict: bool = False,
+    ) -> LeagueLeaders:
+        """Parse the league leader pages of each category concurrently.
+
+        Args:
+            responses: Responses (or exceptions) in LEADERBOARD_CATEGORIES order
+            max_players: Players kept per stat table
+            strict: Raise the first failed page's error instead of leaving
+                its category empty
+
+        Returns:
+            League leaders; categories whose page failed are left empty
+
+        Raises:
+            httpx.HTTPError: If strict and a page request failed
+        """
+        result = cast(LeagueLeaders, {OFFENCE: {}, DEFENCE: {}, SPECIAL_TEAMS: {}})
+        parsing = {}
+
+        for category, response in zip(LEADERBOARD_CATEGORIES, responses):
+            if strict:
+                if isinstance(response, BaseException):
+                    raise response
+                response.raise_for_status()
+
+            if isinstance(response, httpx.Response) and response.status_code == 200:
+                parsing[category] = self._parse_page_async(
+                    (str(response.url), max_players),
+                    response.text,
+                    parse_leaderboard_category,
+                    category,
+                    None,
+                    max_players,
+                )
+
+        parsed = await asyncio.gather(*parsing.values())
+        for category, category_data in zip(parsing, parsed):
+            result[category.upper()] = category_data
+
+        return result
+
+    async def _leaderboards_by_season(
+        self,
+        web_get: Callable[[str], Awaitable[httpx.Response]],
+        seasons: list[int],
+        concurrency: int,
+        max_players: int,
+    ) -> dict[int, LeagueLeaders]:
+        """Fetch and parse the league leaders of many seasons concurrently.
+
+        Every (season, category) page is fetched with at most ``concurrency``
+        requests in flight, and each season is parsed as soon as its three
+        pages arrive, while later pages are still downloading.
+
+        Args:
+            web_get: Coroutine function fetching a cfl.ca page
+            seasons: Seasons to fetch
+            concurrency: Maximum page requests in flight
+            max_players: Players kept per stat table
+
+        Returns:
+            League leaders keyed by season
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> httpx.Response:
+            async with semaphore:
+                return await web_get(url)
+
+        async def leaders(season: int) -> LeagueLeaders:
+            responses = await asyncio.gather(
+                *(
+                    fetch(self._leaderboard_url(category, season))
+                    for category in LEADERBOARD_CATEGORIES
+                ),
+                return_exceptions=True,
+            )
+
+            return await self._parse_leaderboards(responses, max_players)
+
+        results = await asyncio.gather(*(leaders(season) for season in seasons))
+
+        return dict(zip(seasons, results))
@@ -0,0 +1,104 @@
+"""Concurrent batch fetching of entities by ID."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from .constants import DEFAULT_CONCURRENCY
+from .exceptions import CFLAPIError
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+@dataclass
+class BatchResult(Generic[K, T]):
+    """Per-ID outcome of a batch fetch.
+
+    Attributes:
+        results: Fetched entities keyed by ID
+        errors: API errors (e.g. CFLAPINotFoundError) keyed by ID
+    """
+
+    results: dict[K, T] = field(default_factory=dict)
+    errors: dict[K, CFLAPIError] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every ID was fetched successfully."""
+        return not self.errors
+
+    def __len__(self) -> int:
+        return len(self.results) + len(self.errors)
+
+
+def fetch_batch(
+    ids: Iterable[K],
+    fetch: Callable[[K], T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BatchResult[K, T]:
+    """Fetch entities for many IDs in a thread pool.
+
+    Args:
+        ids: IDs to fetch; duplicates are fetched once
+        fetch: Function fetching a single ID
+        concurrency: Maximum requests in flight
+
+    Returns:
+        Results and API errors keyed by ID
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    batch: BatchResult[K, T] = BatchResult()
+    if not unique_ids:
+        return batch
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(unique_ids))) as executor:
+        futures = {item_id: executor.submit(fetch, item_id) for item_id in unique_ids}
+
+        for item_id, future in futures.items():
+            try:
+                batch.results[item_id] = future.result()
+            except CFLAPIError as e:
+                batch.errors[item_id] = e
+
+    return batch
+
+
+async def fetch_batch_async(
+    ids: Iterable[K],
+    fetch: Callable[[K], Awaitable[T]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BatchResult[K, T]:
+    """Fetch entities for many IDs concurrently on the event loop.
+
+    Args:
+        ids: IDs to fetch; duplicates are fetched once
+        fetch: Coroutine function fetching a single ID
+        concurrency: Maximum requests in flight
+
+    Returns:
+        Results and API errors keyed by ID
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(item_id: K) -> T:
+        async with semaphore:
+            return await fetch(item_id)
+
+    outcomes = await asyncio.gather(
+        *(bounded(item_id) for item_id in unique_ids), return_exceptions=True
+    )
+
+    batch: BatchResult[K, T] = BatchResult()
+    for item_id, outcome in zip(unique_ids, outcomes):
+        if isinstance(outcome, CFLAPIError):
+            batch.errors[item_id] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            batch.results[item_id] = outcome
+
+    return batch
@@ -0,0 +1,423 @@
+"""Response cache backends and per-endpoint cache policies."""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from .constants import (
+    API_ENDPOINTS,
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_SQLITE_TIMEOUT,
+    LIVE_CACHE_TTLS,
+)
+from .decoding import json_default
+
+
+def _template_pattern(template: str) -> re.Pattern:
+    parts = re.split(r"\{[^}]+\}", template)
+
+    return re.compile("^" + "[^/]+".join(re.escape(part) for part in parts) + "$")
+
+
+# Literal templates first so "/players/positions" wins over "/players/{player_id}"
+_ENDPOINT_PATTERNS = [
+    (template, _template_pattern(template))
+    for template in sorted(API_ENDPOINTS, key=lambda t: t.count("{"))
+]
+
+
+def endpoint_template(endpoint: str) -> str | None:
+    """Find the endpoint constant a formatted endpoint was built from.
+
+    Args:
+        endpoint: Formatted endpoint path (e.g. "/seasons/35/fixtures")
+
+    Returns:
+        Endpoint template (e.g. SEASON_FIXTURES_ENDPOINT), or None if unknown
+    """
+    path = "/" + endpoint.split("?", 1)[0].strip("/")
+
+    for template, pattern in _ENDPOINT_PATTERNS:
+        if pattern.match(path):
+            return template
+
+    return None
+
+
+def sizeof(value: Any) -> int:
+    """Estimate the size of a cached value as its compact JSON length.
+
+    Only used when the raw response size is not known, since it encodes
+    the whole value.
+    """
+    return len(json.dumps(value, separators=(",", ":"), default=json_default))
+
+
+class CacheEntry(NamedTuple):
+    """Cached value with its freshness and stale windows and invalidation tag"""
+
+    value: Any
+    expires_at: float
+    stale_until: float
+    tag: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry is still within its TTL."""
+        return time.time() < self.expires_at
+
+    def stale_for(self, window: float) -> bool:
+        """Whether an expired entry is still within window seconds of expiring."""
+        return time.time() < self.expires_at + window
+
+
+class CacheBackend(ABC):
+    """Interface for response cache storage.
+
+    Keys are normalized request keys; tags are endpoint templates so that
+    every cached page of an endpoint can be invalidated at once.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Get an entry that is fresh or still within its stale window."""
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tag: str | None = None,
+        stale_ttl: float = 0.0,
+        size: int | None = None,
+    ) -> None:
+        """Store a value, fresh for ttl seconds and kept stale_ttl seconds longer.
+
+        size is the raw byte length of the response the value was decoded
+        from, when known.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove one entry."""
+
+    @abstractmethod
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Remove every entry whose key starts with prefix."""
+
+    @abstractmethod
+    def invalidate_tag(self, tag: str) -> None:
+        """Remove every entry stored with tag."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-memory LRU cache bounded by entry count and bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        """Initialize memory cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses, measured as raw
+                response bytes (or JSON bytes when the response size is unknown)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, tuple[CacheEntry, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, key: str) -> None:
+        _, size = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+
+            entry, _ = item
+            if entry.stale_until <= time.time():
+                self._pop(key)
+                return None
+
+            self._entries.move_to_end(key)
+
+            return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tag: str | None = None,
+        stale_ttl: float = 0.0,
+        size: int | None = None,
+    ) -> None:
+        if size is None:
+            size = sizeof(value)
+
+        expires_at = time.time() + ttl
+        entry = CacheEntry(value, expires_at, expires_at + stale_ttl, tag)
+
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (entry, size)
+            self.total_bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                self.total_bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._pop(oldest)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._pop(key)
+
+    def invalidate_tag(self, tag: str) -> None:
+        with self._lock:
+            for key in [k for k, (e, _) in self._entries.items() if e.tag == tag]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+class SQLiteCache(CacheBackend):
+    """Disk cache storing zlib-compressed JSON responses in SQLite.
+
+    Entries survive process restarts. The database runs in WAL mode with a
+    busy timeout, and each thread opens its own connection, so several
+    worker processes on one host can share a cache file.
+    """
+
+    _PURGE_INTERVAL = 256
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        max_entries: int | None = None,
+        compression_level: int = 6,
+        timeout: float = DEFAULT_SQLITE_TIMEOUT,
+    ):
+        """Initialize SQLite cache.
+
+        Args:
+            path: Database file path, created if missing
+            max_entries: Maximum stored responses; entries expiring soonest are
+                evicted first (None for no limit)
+            compression_level: zlib compression level (0-9)
+            timeout: Seconds to wait for a lock held by another connection
+        """
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_entries = max_entries
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, "
+                    "tag TEXT, "
+                    "value BLOB NOT NULL, "
+                    "expires_at REAL NOT NULL, "
+                    "stale_until REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_tag ON responses (tag)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_stale_until "
+                    "ON responses (stale_until)"
+                )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must never be used across fork(), so a worker forked
+        # after construction opens its own instead of reusing the parent's.
+        pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != pid:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.pid = pid
+
+        return conn
+
+    def get(self, key: str) -> CacheEntry | None:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires_at, stale_until, tag FROM responses "
+                "WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        blob, expires_at, stale_until, tag = row
+        if stale_until <= time.time():
+            return None
+
+        value = json.loads(zlib.decompress(blob))
+
+        return CacheEntry(value, expires_at, stale_until, tag)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tag: str | None = None,
+        stale_ttl: float = 0.0,
+        size: int | None = None,
+    ) -> None:
+        expires_at = time.time() + ttl
+        blob = zlib.compress(
+            json.dumps(value, separators=(",", ":"), default=json_default).encode(),
+            self.compression_level,
+        )
+
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, tag, value, expires_at, stale_until) VALUES (?, ?, ?, ?, ?)",
+                (key, tag, blob, expires_at, expires_at + stale_ttl),
+            )
+
+        self._writes += 1
+        if self._writes % self._PURGE_INTERVAL == 0:
+            self.purge()
+
+    def delete(self, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def invalidate_tag(self, tag: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses WHERE tag = ?", (tag,))
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def purge(self) -> None:
+        """Delete entries past their stale window and enforce max_entries."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses WHERE stale_until <= ?", (time.time(),))
+
+            if self.max_entries is not None:
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY stale_until DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def close(self) -> None:
+        """Close this thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+
+@dataclass
+class CachePolicy:
+    """Per-endpoint cache TTLs.
+
+    Attributes:
+        ttls: Seconds to cache each endpoint template; endpoints not listed are not cached
+        live_ttls: TTLs that replace ttls while is_live() returns True
+        is_live: Predicate telling whether games are currently in progress
+        stale_while_revalidate: Seconds after expiry during which the stale value
+            is returned immediately while a background refresh runs
+        stale_if_error: Seconds after expiry during which the stale value is
+            returned if the upstream request fails
+    """
+
+    ttls: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_CACHE_TTLS))
+    live_ttls: dict[str, float] = field(default_factory=lambda: dict(LIVE_CACHE_TTLS))
+    is_live: Callable[[], bool] | None = None
+    stale_while_revalidate: float = 0.0
+    stale_if_error: float = 0.0
+
+    @property
+    def stale_ttl(self) -> float:
+        """Seconds an expired entry must be kept for the stale windows."""
+        return max(self.stale_while_revalidate, self.stale_if_error)
+
+    def ttl(self, template: str | None) -> float | None:
+        """Get the TTL for an endpoint template.
+
+        Args:
+            template: Endpoint template
+
+        Returns:
+            Seconds to cache, or None if the endpoint is not cached
+        """
+        if template is None:
+            return None
+
+        if template in self.live_ttls and self.is_live is not None and self.is_live():
+            return self.live_ttls[template]
+
+        return self.ttls.get(template)
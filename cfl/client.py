@@ -1,31 +1,34 @@
 """CFL API Client for accessing CFL data."""
 
 import asyncio
-import json
-from typing import cast
-from urllib.parse import urljoin
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar, cast
 
 import httpx
-from bs4 import BeautifulSoup
 
+from .base import (
+    _RESPONSE_SIZE,
+    STALE_IF_ERROR_EXCEPTIONS,
+    BaseCFLClient,
+    _PageCollector,
+)
+from .batch import BatchResult, fetch_batch
+from .cache import endpoint_template
 from .constants import (
-    BASE_API_URL,
-    BASE_WEB_URL,
     COLLEGE_ENDPOINT,
     COLLEGES_ENDPOINT,
-    DEFAULT_HEADERS,
+    DEFAULT_CONCURRENCY,
     DEFAULT_LIMIT,
     DEFAULT_PAGE,
     DEFAULT_SEASON,
-    DEFAULT_TIMEOUT,
-    DEFENCE,
     FIXTURE_ENDPOINT,
-    FIXTURES_ENDPOINT,
-    LEADERBOARD_URL,
+    LEADERBOARD_CATEGORIES,
     LEDGER_ENDPOINT,
-    MAX_SEASON,
-    MIN_SEASON,
-    OFFENCE,
+    MAX_LEADERBOARD_PLAYERS,
     PLAYER_ENDPOINT,
     PLAYER_LOOKUP_ENDPOINT,
     PLAYER_PIMS_ENDPOINT,
@@ -40,9 +43,8 @@ from .constants import (
     ROSTERS_ENDPOINT,
     ROSTERS_SUMMARY_ENDPOINT,
     SEASON_ENDPOINT,
-    SEASON_FIXTURES_ENDPOINT,
     SEASONS_ENDPOINT,
-    SPECIAL_TEAMS,
+    STANDINGS_URL,
     TEAM_ENDPOINT,
     TEAM_ROSTER_ENDPOINT,
     TEAM_STAT_ENDPOINT,
@@ -50,18 +52,16 @@ from .constants import (
     TEAMS_ENDPOINT,
     VENUE_ENDPOINT,
     VENUES_ENDPOINT,
-    get_random_user_agent,
 )
 from .exceptions import (
-    CFLAPIAuthenticationError,
     CFLAPIConnectionError,
+    CFLAPIError,
     CFLAPINotFoundError,
-    CFLAPIServerError,
     CFLAPITimeoutError,
-    CFLAPIValidationError,
 )
-from .leaderboard import parse_leaderboard_category
 from .logger import logger
+from .standings import parse_standings
+from .streaming import json_stream_parser
 from .types import (
     College,
     Fixture,
@@ -77,32 +77,27 @@ from .types import (
     RosterSummary,
     Season,
     Standings,
-    StandingsStats,
     Team,
     TeamStats,
     Venue,
 )
 
+T = TypeVar("T")
 
-class CFLClient:
-    """Client for interacting with the CFL API."""
 
-    def __init__(
-        self,
-        base_url: str = BASE_API_URL,
-        timeout: int = DEFAULT_TIMEOUT,
-    ):
-        """Initialize CFL API client.
+class CFLClient(BaseCFLClient):
+    """Client for interacting with the CFL API."""
 
-        Args:
-            base_url: API base URL
-            timeout: Request timeout in seconds
-        """
+    # Background event loop and pooled async client for cfl.ca leaderboards,
+    # started on first use. The lock only guards starting the loop.
+    _loop: asyncio.AbstractEventLoop | None = None
+    _loop_thread: threading.Thread | None = None
+    _loop_lock = threading.Lock()
+    _web_client: httpx.AsyncClient | None = None
 
-        self.base_url = base_url
-        self.timeout = timeout
-        self.headers = {**DEFAULT_HEADERS, "User-Agent": get_random_user_agent()}
-        self.client = httpx.Client(timeout=timeout)
+    def _create_client(self) -> httpx.Client:
+        """Create the pooled HTTP client used for API requests."""
+        return httpx.Client(**self._client_options())
 
     def __enter__(self):
         return self
@@ -111,65 +106,78 @@ class CFLClient:
         self.close()
 
     def close(self):
-        """Close HTTP client."""
-        self.client.close()
-        logger.debug("Closed HTTP client")
+        """Finish background refreshes, then close HTTP clients and the event loop."""
+        with self._refresh_lock:
+            self._closed = True
 
-    def _url(self, endpoint: str) -> str:
-        """Build full URL from endpoint.
+        for thread in list(self._background_tasks):
+            thread.join()
 
-        Args:
-            endpoint: API endpoint path
+        self.client.close()
 
-        Returns:
-            Complete URL
-        """
+        loop = self._loop
+        if loop is not None:
+            if self._web_client is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._web_client.aclose(), loop
+                ).result()
+                self._web_client = None
 
-        return urljoin(self.base_url, f"/api/{endpoint.lstrip('/')}")
+            loop.call_soon_threadsafe(loop.stop)
+            if self._loop_thread is not None:
+                self._loop_thread.join()
+            loop.close()
+            self._loop = self._loop_thread = None
 
-    def _handle_response(self, response: httpx.Response) -> dict:
-        """Process API response and handle errors.
+        logger.debug("Closed HTTP client")
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict | None = None,
+        json_data: dict | None = None,
+        headers: dict | None = None,
+    ) -> httpx.Response:
+        """Send HTTP request, retrying transient failures per the retry policy.
 
         Args:
-            response: HTTP response
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            json_data: JSON request body
+            headers: Extra request headers
 
         Returns:
-            Response JSON data
-
-        Raises:
-            CFLAPIResponseError: For API errors
+            HTTP response of the last attempt
         """
-        logger.debug("Response status: %s", response.status_code)
+        started = time.monotonic()
+        retries = 0
 
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
+        while True:
+            if self.api_rate_limiter is not None:
+                self.api_rate_limiter.acquire()
 
             try:
-                error_data = e.response.json()
-                message = error_data.get("message", str(e))
-            except (ValueError, KeyError):
-                message = str(e)
-
-            if status_code == 404:
-                raise CFLAPINotFoundError(message) from e
-            elif status_code in (401, 403):
-                raise CFLAPIAuthenticationError(status_code, message) from e
-            elif status_code == 400:
-                raise CFLAPIValidationError(message) from e
-            elif status_code >= 500:
-                raise CFLAPIServerError(status_code, message) from e
+                response = self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    headers=headers,
+                )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, retries, started, error=e)
+                if delay is None:
+                    raise
             else:
-                raise CFLAPIValidationError(message) from e
-
-        try:
-            return response.json()
-
-        except json.JSONDecodeError:
-            logger.warning("Failed to decode JSON response")
+                delay = self._retry_delay(method, retries, started, response=response)
+                if delay is None:
+                    return response
+                response.close()
 
-            return {}
+            time.sleep(delay)
+            retries += 1
 
     def _request(
         self,
@@ -195,16 +203,18 @@ class CFLClient:
         """
         url = self._url(endpoint)
         logger.debug("%s %s", method, url)
+        key, validated = self._conditional(method, endpoint, params)
 
         try:
-            response = self.client.request(
-                method=method,
-                url=url,
+            response = self._send(
+                method,
+                url,
                 params=params,
-                json=json_data,
+                json_data=json_data,
+                headers=validated.headers() if validated else None,
             )
 
-            return self._handle_response(response)
+            return self._process_response(response, key, validated)
 
         except httpx.ConnectError as e:
             logger.error("Connection error: %s", e)
@@ -223,7 +233,7 @@ class CFLClient:
         endpoint: str,
         params: dict | None = None,
     ) -> dict:
-        """Send GET request to API.
+        """Send GET request to API, serving it from the cache when possible.
 
         Args:
             endpoint: API endpoint
@@ -232,8 +242,92 @@ class CFLClient:
         Returns:
             Response JSON data
         """
+        key = self._request_key("GET", endpoint, params)
+        template = endpoint_template(endpoint)
+        self._raise_if_not_found(key)
+
+        try:
+            return self._cached(
+                key,
+                template,
+                lambda: self._request("GET", endpoint, params=params),
+            )
+
+        except CFLAPINotFoundError as e:
+            self._remember_not_found(key, template, e)
+            raise
+
+    def _cached(self, key: str, template: str | None, fetch: Callable[[], T]) -> T:
+        """Serve a request from the cache, falling back to fetch.
+
+        Fresh entries are returned directly. Entries inside the
+        stale-while-revalidate window are returned immediately while a
+        background thread refreshes them, and entries inside the
+        stale-if-error window are returned if the upstream request fails.
+
+        Args:
+            key: Request key
+            template: Endpoint template used for the cache policy
+            fetch: Function performing the upstream request
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        entry = self._cache_get(key)
+        if entry is not None:
+            if entry.fresh:
+                return entry.value
+
+            if entry.stale_for(self.cache_policy.stale_while_revalidate):
+                self._revalidate(key, template, fetch)
+                return entry.value
+
+        try:
+            return self._coalesced(key, lambda: self._fetch(key, template, fetch))
+
+        except STALE_IF_ERROR_EXCEPTIONS as e:
+            if self._serve_stale_on_error(entry, key, e):
+                return entry.value  # type: ignore
+
+            raise
+
+    def _coalesced(self, key: str, fn: Callable[[], T]) -> T:
+        """Run fn, sharing it with concurrent identical calls when coalescing."""
+        if self._singleflight is None:
+            return fn()
 
-        return self._request("GET", endpoint, params=params)
+        return self._singleflight.do(key, fn)
+
+    def _fetch(self, key: str, template: str | None, fetch: Callable[[], T]) -> T:
+        """Fetch a value from upstream and cache it."""
+        token = _RESPONSE_SIZE.set(None)
+        try:
+            value = fetch()
+            size = _RESPONSE_SIZE.get()
+        finally:
+            _RESPONSE_SIZE.reset(token)
+
+        self._cache_set(key, template, value, size)
+
+        return value
+
+    def _revalidate(self, key: str, template: str | None, fetch: Callable) -> None:
+        """Refresh a stale cache entry in a background thread."""
+        if not self._begin_refresh(key):
+            return
+
+        def refresh():
+            try:
+                self._coalesced(key, lambda: self._fetch(key, template, fetch))
+            except STALE_IF_ERROR_EXCEPTIONS + (CFLAPIError,) as e:
+                logger.warning("Background refresh of %s failed: %s", key, e)
+            finally:
+                self._background_tasks.discard(threading.current_thread())
+                self._end_refresh(key)
+
+        thread = threading.Thread(target=refresh, daemon=True)
+        self._background_tasks.add(thread)
+        thread.start()
 
     def _paginated_get(
         self,
@@ -253,13 +347,194 @@ class CFLClient:
         Returns:
             List of items from the requested page
         """
-        params = params or {}
-        params["limit"] = limit
-        params["page"] = page
-
-        results = self._get(endpoint, params)
+        results = self._get(endpoint, self._page_params(params, limit, page))
         return cast(list[dict], results)
 
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[dict]:
+        """Iterate over every item of a paginated endpoint.
+
+        Pages are fetched lazily, one at a time, until a short or empty page
+        comes back, so memory stays bounded by page_size and callers can stop
+        early.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Yields:
+            Items in page order
+        """
+        page = start_page
+        fetched = 0
+
+        while max_pages is None or fetched < max_pages:
+            items = self._paginated_get(
+                endpoint, dict(params or {}), limit=page_size, page=page
+            )
+            yield from items
+
+            if len(items) < page_size:
+                return
+
+            page += 1
+            fetched += 1
+
+    def _fetch_all_pages(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[dict]:
+        """Fetch every page of a paginated endpoint concurrently.
+
+        The total is not exposed by the API, so up to ``concurrency`` pages
+        are kept in flight ahead of the page being consumed, until a short or
+        empty page marks the end.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        self._check_concurrency(concurrency)
+
+        def fetch(page: int) -> list[dict]:
+            return self._paginated_get(
+                endpoint, dict(params or {}), limit=page_size, page=page
+            )
+
+        collector = _PageCollector()
+        next_page = DEFAULT_PAGE
+        pending: deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                for _ in range(concurrency):
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+
+                while pending:
+                    items = pending.popleft().result()
+                    collector.add(items)
+
+                    if len(items) < page_size:
+                        break
+
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        return collector.items
+
+    def _stream(self, endpoint: str, params: dict | None = None) -> Iterator[dict]:
+        """Stream the items of a JSON array response as they are parsed.
+
+        The body is parsed incrementally from the response bytes, so memory
+        stays bounded by one item. Streamed requests are rate limited but
+        bypass the cache, coalescing, conditional requests and retries.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Yields:
+            Items of the response array
+
+        Raises:
+            CFLAPIConnectionError: For connection failures
+            CFLAPITimeoutError: For request timeouts
+        """
+        url = self._url(endpoint)
+        logger.debug("GET %s (streaming)", url)
+
+        if self.api_rate_limiter is not None:
+            self.api_rate_limiter.acquire()
+
+        try:
+            with self.client.stream("GET", url, params=params) as response:
+                if response.is_error:
+                    response.read()
+                    self._handle_response(response)
+
+                template = endpoint_template(endpoint)
+                parser = json_stream_parser()
+                for chunk in response.iter_bytes():
+                    for item in parser.feed(chunk):
+                        yield self._stream_item(item, template)
+                for item in parser.close():
+                    yield self._stream_item(item, template)
+
+        except httpx.ConnectError as e:
+            logger.error("Connection error: %s", e)
+            raise CFLAPIConnectionError(f"Failed to connect: {e}") from e
+
+        except httpx.TimeoutException as e:
+            logger.error("Request timed out: %s", e)
+            raise CFLAPITimeoutError(f"Request timed out: {e}") from e
+
+    def prefetch_relations(
+        self,
+        items: list[T],
+        relations: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[T]:
+        """Embed related entities on listing results, fetching each one once.
+
+        Distinct foreign keys (venue_id, season_id, player_id, college_id) are
+        gathered from items and fetched concurrently, so a season schedule with
+        venues costs one request per unique venue rather than one per game.
+
+        Args:
+            items: Entities from a listing (e.g. get_fixtures)
+            relations: Relations to embed: "venue", "season", "player", "college"
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Copies of items with related entities under relations; entities
+            that could not be fetched are left out
+
+        Raises:
+            ValueError: If a relation name is unknown
+        """
+        names = tuple(relations)
+        fetchers = {
+            "venue": self.get_venue,
+            "season": self.get_season,
+            "player": self.get_player,
+            "college": self.get_college,
+        }
+
+        batch = fetch_batch(
+            self._relation_keys(items, names),
+            lambda key: fetchers[key[0]](key[1]),
+            concurrency,
+        )
+        if batch.errors:
+            logger.warning("Failed to prefetch %d related entities", len(batch.errors))
+
+        return cast(list[T], self._attach_relations(items, names, batch.results))
+
     def get_teams(
         self,
     ) -> list[Team]:
@@ -321,6 +596,27 @@ class CFLClient:
         results = self._get(endpoint)
         return cast(Venue, results)
 
+    def iter_venues(
+        self,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[Venue]:
+        """Iterate over all CFL venues, fetching pages on demand.
+
+        Args:
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Iterator yielding one venue at a time
+        """
+        items = self._iter_pages(
+            VENUES_ENDPOINT, None, page_size, start_page, max_pages
+        )
+        return cast(Iterator[Venue], items)
+
     def get_players(
         self,
         position: str | None = None,
@@ -343,15 +639,7 @@ class CFLClient:
         Returns:
             List of players
         """
-        params: dict = {}
-        if position:
-            params["position"] = position
-        if college_id:
-            params["college_id"] = college_id
-        if sort_by:
-            params["sort_by"] = sort_by
-        if sort_order:
-            params["sort_order"] = sort_order
+        params = self._players_params(position, college_id, sort_by, sort_order)
 
         results = self._paginated_get(
             PLAYERS_ENDPOINT, params=params, limit=limit, page=page
@@ -369,13 +657,96 @@ class CFLClient:
             Player details
         """
         endpoint = PLAYER_ENDPOINT.format(player_id=player_id)
-        params: dict = {}
-        if with_college:
-            params["with"] = "college"
+        params = self._with_params(college=with_college)
 
         results = self._get(endpoint, params=params or None)
         return cast(Player, results)
 
+    def iter_players(
+        self,
+        position: str | None = None,
+        college_id: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[Player]:
+        """Iterate over CFL players with optional filters, fetching pages on demand.
+
+        Args:
+            position: Position code filter (e.g. "QB", "RB", "DB")
+            college_id: Filter by college ID
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Iterator yielding one player at a time
+        """
+        items = self._iter_pages(
+            PLAYERS_ENDPOINT,
+            self._players_params(position, college_id, sort_by, sort_order),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(Iterator[Player], items)
+
+    def get_all_players(
+        self,
+        position: str | None = None,
+        college_id: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[Player]:
+        """Get every page of players, fetching pages concurrently.
+
+        Args:
+            position: Position code filter (e.g. "QB", "RB", "DB")
+            college_id: Filter by college ID
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = self._fetch_all_pages(
+            PLAYERS_ENDPOINT,
+            self._players_params(position, college_id, sort_by, sort_order),
+            page_size,
+            concurrency,
+        )
+        return cast(list[Player], results)
+
+    def get_players_by_ids(
+        self,
+        player_ids: Iterable[int],
+        with_college: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BatchResult[int, Player]:
+        """Get details for many players concurrently.
+
+        Args:
+            player_ids: Player IDs; duplicates are fetched once
+            with_college: Embed college object under relations.college
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Players and per-ID API errors (e.g. 404s) keyed by player ID
+        """
+        return fetch_batch(
+            player_ids,
+            lambda player_id: self.get_player(player_id, with_college=with_college),
+            concurrency,
+        )
+
     def search_players(self, pattern: str) -> list[PlayerLookup]:
         """Search players by name pattern (regex supported).
 
@@ -426,6 +797,27 @@ class CFLClient:
         results = self._get(endpoint)
         return cast(Season, results)
 
+    def iter_seasons(
+        self,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[Season]:
+        """Iterate over all seasons, fetching pages on demand.
+
+        Args:
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Iterator yielding one season at a time
+        """
+        items = self._iter_pages(
+            SEASONS_ENDPOINT, None, page_size, start_page, max_pages
+        )
+        return cast(Iterator[Season], items)
+
     def get_fixtures(
         self,
         season_id: int | None = None,
@@ -434,6 +826,8 @@ class CFLClient:
         venue_id: int | None = None,
         page: int = DEFAULT_PAGE,
         limit: int = DEFAULT_LIMIT,
+        with_venue: bool = False,
+        with_season: bool = False,
     ) -> list[Fixture]:
         """Get all fixtures (games).
 
@@ -444,24 +838,21 @@ class CFLClient:
             venue_id: Filter by venue ID
             page: Page number
             limit: Items per page
+            with_venue: Prefetch each distinct venue into relations.venue
+            with_season: Prefetch each distinct season into relations.season
 
         Returns:
             List of fixtures
         """
-        params: dict = {}
-        if home_team_id:
-            params["home_team_id"] = home_team_id
-        if away_team_id:
-            params["away_team_id"] = away_team_id
-        if venue_id:
-            params["venue_id"] = venue_id
-
-        if season_id:
-            endpoint = SEASON_FIXTURES_ENDPOINT.format(season_id=season_id)
-        else:
-            endpoint = FIXTURES_ENDPOINT
+        endpoint, params = self._fixtures_request(
+            season_id, home_team_id, away_team_id, venue_id
+        )
 
         results = self._paginated_get(endpoint, params=params, limit=limit, page=page)
+        relations = self._relation_names(venue=with_venue, season=with_season)
+        if relations:
+            results = self.prefetch_relations(results, relations)
+
         return cast(list[Fixture], results)
 
     def get_fixture(
@@ -481,16 +872,77 @@ class CFLClient:
             Fixture details
         """
         endpoint = FIXTURE_ENDPOINT.format(fixture_id=fixture_id)
-        params: dict = {}
-        with_values = [
-            k for k, v in [("venue", with_venue), ("season", with_season)] if v
-        ]
-        if with_values:
-            params["with"] = ",".join(with_values)
+        params = self._with_params(venue=with_venue, season=with_season)
 
         results = self._get(endpoint, params=params or None)
         return cast(Fixture, results)
 
+    def iter_fixtures(
+        self,
+        season_id: int | None = None,
+        home_team_id: int | None = None,
+        away_team_id: int | None = None,
+        venue_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[Fixture]:
+        """Iterate over fixtures (games), fetching pages on demand.
+
+        Args:
+            season_id: Optional season filter
+            home_team_id: Filter by home team ID
+            away_team_id: Filter by away team ID
+            venue_id: Filter by venue ID
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Iterator yielding one fixture at a time
+        """
+        endpoint, params = self._fixtures_request(
+            season_id, home_team_id, away_team_id, venue_id
+        )
+        items = self._iter_pages(endpoint, params, page_size, start_page, max_pages)
+        return cast(Iterator[Fixture], items)
+
+    def get_all_fixtures(
+        self,
+        season_id: int | None = None,
+        home_team_id: int | None = None,
+        away_team_id: int | None = None,
+        venue_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        with_venue: bool = False,
+        with_season: bool = False,
+    ) -> list[Fixture]:
+        """Get every page of fixtures (games), fetching pages concurrently.
+
+        Args:
+            season_id: Optional season filter
+            home_team_id: Filter by home team ID
+            away_team_id: Filter by away team ID
+            venue_id: Filter by venue ID
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+            with_venue: Prefetch each distinct venue into relations.venue
+            with_season: Prefetch each distinct season into relations.season
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        endpoint, params = self._fixtures_request(
+            season_id, home_team_id, away_team_id, venue_id
+        )
+        results = self._fetch_all_pages(endpoint, params, page_size, concurrency)
+        relations = self._relation_names(venue=with_venue, season=with_season)
+        if relations:
+            results = self.prefetch_relations(results, relations, concurrency)
+
+        return cast(list[Fixture], results)
+
     def get_rosters(
         self,
     ) -> list[Roster]:
@@ -543,11 +995,7 @@ class CFLClient:
         Returns:
             List of roster player entries
         """
-        params: dict = {}
-        if player_id:
-            params["player_id"] = player_id
-        if with_player:
-            params["with"] = "player"
+        params = self._roster_players_params(player_id, with_player)
 
         results = self._paginated_get(
             ROSTER_PLAYERS_ENDPOINT, params=params, limit=limit, page=page
@@ -567,13 +1015,66 @@ class CFLClient:
             Roster player details
         """
         endpoint = ROSTER_PLAYER_ENDPOINT.format(rosterplayer_id=rosterplayer_id)
-        params: dict = {}
-        if with_player:
-            params["with"] = "player"
+        params = self._with_params(player=with_player)
 
         results = self._get(endpoint, params=params or None)
         return cast(RosterPlayer, results)
 
+    def iter_roster_players(
+        self,
+        player_id: int | None = None,
+        with_player: bool = False,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[RosterPlayer]:
+        """Iterate over roster player entries, fetching pages on demand.
+
+        Args:
+            player_id: Filter to a specific player's roster entry
+            with_player: Embed full player object under relations.player
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Iterator yielding one roster player entry at a time
+        """
+        items = self._iter_pages(
+            ROSTER_PLAYERS_ENDPOINT,
+            self._roster_players_params(player_id, with_player),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(Iterator[RosterPlayer], items)
+
+    def get_all_roster_players(
+        self,
+        player_id: int | None = None,
+        with_player: bool = False,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[RosterPlayer]:
+        """Get every page of roster player entries, fetching pages concurrently.
+
+        Args:
+            player_id: Filter to a specific player's roster entry
+            with_player: Embed full player object under relations.player
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = self._fetch_all_pages(
+            ROSTER_PLAYERS_ENDPOINT,
+            self._roster_players_params(player_id, with_player),
+            page_size,
+            concurrency,
+        )
+        return cast(list[RosterPlayer], results)
+
     def get_roster_player_states(self) -> list[RosterPlayerState]:
         """Get all valid roster player state definitions.
 
@@ -619,13 +1120,7 @@ class CFLClient:
         Returns:
             List of colleges
         """
-        params: dict = {}
-        if name:
-            params["name"] = name
-        if sort_by:
-            params["sort_by"] = sort_by
-        if sort_order:
-            params["sort_order"] = sort_order
+        params = self._colleges_params(name, sort_by, sort_order)
 
         results = self._paginated_get(
             COLLEGES_ENDPOINT, params=params, limit=limit, page=page
@@ -645,6 +1140,65 @@ class CFLClient:
         results = self._get(endpoint)
         return cast(College, results)
 
+    def iter_colleges(
+        self,
+        name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[College]:
+        """Iterate over colleges with optional filters, fetching pages on demand.
+
+        Args:
+            name: Filter by college name
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Iterator yielding one college at a time
+        """
+        items = self._iter_pages(
+            COLLEGES_ENDPOINT,
+            self._colleges_params(name, sort_by, sort_order),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(Iterator[College], items)
+
+    def get_all_colleges(
+        self,
+        name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[College]:
+        """Get every page of colleges, fetching pages concurrently.
+
+        Args:
+            name: Filter by college name
+            sort_by: Field to sort by
+            sort_order: "asc" or "desc"
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = self._fetch_all_pages(
+            COLLEGES_ENDPOINT,
+            self._colleges_params(name, sort_by, sort_order),
+            page_size,
+            concurrency,
+        )
+        return cast(list[College], results)
+
     def get_team_stats(
         self,
         season_id: int | None = None,
@@ -657,13 +1211,30 @@ class CFLClient:
         Returns:
             List of team statistics
         """
-        params = {}
-        if season_id:
-            params["season_id"] = season_id
+        params = self._season_params(season_id)
 
         results = self._get(TEAM_STATS_ENDPOINT, params=params)
         return cast(list[TeamStats], results)
 
+    def stream_team_stats(
+        self,
+        season_id: int | None = None,
+    ) -> Iterator[TeamStats]:
+        """Stream team statistics one record at a time.
+
+        Records are parsed incrementally from the response, so peak memory
+        stays constant however many fixtures each record carries. Responses
+        are not cached.
+
+        Args:
+            season_id: Optional season filter
+
+        Returns:
+            Iterator yielding one team stats record at a time
+        """
+        items = self._stream(TEAM_STATS_ENDPOINT, self._season_params(season_id))
+        return cast(Iterator[TeamStats], items)
+
     def get_team_stat(
         self, team_stats_id: int, season_id: int | None = None
     ) -> TeamStats:
@@ -676,9 +1247,7 @@ class CFLClient:
             Team statistics
         """
         endpoint = TEAM_STAT_ENDPOINT.format(team_stats_id=team_stats_id)
-        params = {}
-        if season_id:
-            params["season_id"] = season_id
+        params = self._season_params(season_id)
 
         results = self._get(endpoint, params=params)
         return cast(TeamStats, results)
@@ -699,10 +1268,7 @@ class CFLClient:
         Returns:
             List of player statistics
         """
-        params = {}
-
-        if season_id:
-            params["season_id"] = season_id
+        params = self._season_params(season_id)
 
         results = self._paginated_get(
             PLAYER_STATS_ENDPOINT, params=params, limit=limit, page=page
@@ -722,6 +1288,81 @@ class CFLClient:
         results = self._get(endpoint)
         return cast(PlayerStats, results)
 
+    def iter_player_stats(
+        self,
+        season_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        start_page: int = DEFAULT_PAGE,
+        max_pages: int | None = None,
+    ) -> Iterator[PlayerStats]:
+        """Iterate over cumulative player statistics, fetching pages on demand.
+
+        Args:
+            season_id: Optional season filter
+            page_size: Items requested per page
+            start_page: First page to fetch
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            Iterator yielding one player stats record at a time
+        """
+        items = self._iter_pages(
+            PLAYER_STATS_ENDPOINT,
+            self._season_params(season_id),
+            page_size,
+            start_page,
+            max_pages,
+        )
+        return cast(Iterator[PlayerStats], items)
+
+    def get_all_player_stats(
+        self,
+        season_id: int | None = None,
+        page_size: int = DEFAULT_LIMIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[PlayerStats]:
+        """Get every page of cumulative player statistics, fetching pages concurrently.
+
+        Args:
+            season_id: Optional season filter
+            page_size: Items requested per page
+            concurrency: Maximum pages requested at once
+
+        Returns:
+            All items in page order, de-duplicated by ID
+        """
+        results = self._fetch_all_pages(
+            PLAYER_STATS_ENDPOINT,
+            self._season_params(season_id),
+            page_size,
+            concurrency,
+        )
+        return cast(list[PlayerStats], results)
+
+    def stream_player_stats(
+        self,
+        season_id: int | None = None,
+        page: int = DEFAULT_PAGE,
+        limit: int = DEFAULT_LIMIT,
+    ) -> Iterator[PlayerStats]:
+        """Stream one page of cumulative player statistics one record at a time.
+
+        Records are parsed incrementally from the response, so peak memory
+        stays constant however large limit is. Responses are not cached.
+
+        Args:
+            season_id: Optional season filter
+            page: Page number
+            limit: Items per page
+
+        Returns:
+            Iterator yielding one player stats record at a time
+        """
+        params = self._page_params(self._season_params(season_id), limit, page)
+
+        items = self._stream(PLAYER_STATS_ENDPOINT, params)
+        return cast(Iterator[PlayerStats], items)
+
     def get_player_pims(self, player_id: int) -> PlayerStats:
         """Get player stats by PIMS ID (player id).
 
@@ -735,108 +1376,203 @@ class CFLClient:
         results = self._get(endpoint)
 
         if results:
-            results["photo_url"] = (
-                f"https://static.cfl.ca/wp-content/uploads/{player_id}.png"
-            )
+            results["photo_url"] = self._pims_photo_url(player_id)
 
         return cast(PlayerStats, results)
 
-    def get_standings(self, year: int = DEFAULT_SEASON) -> Standings:
+    def get_player_stats_by_ids(
+        self,
+        player_ids: Iterable[int],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BatchResult[int, PlayerStats]:
+        """Get player stats by PIMS ID for many players concurrently.
+
+        Args:
+            player_ids: Player IDs; duplicates are fetched once
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Player statistics and per-ID API errors (e.g. 404s) keyed by player ID
+        """
+        return fetch_batch(player_ids, self.get_player_pims, concurrency)
+
+    def get_standings(
+        self, year: int = DEFAULT_SEASON, strict: bool = False
+    ) -> Standings:
         """Get Standings data of a season
 
         Args:
             year: Season year (valid options: 2023-2026)
+            strict: Raise on a failed page instead of returning empty data
 
         Returns:
             Dictionary containing standings data by division
         """
-        if year < MIN_SEASON or year > MAX_SEASON:
-            raise ValueError(f"Year must be between {MIN_SEASON} and {MAX_SEASON}")
+        url = self._standings_url(year)
+
+        def fetch() -> Standings:
+            if self.web_rate_limiter is not None:
+                self.web_rate_limiter.acquire()
 
-        url = f"{BASE_WEB_URL}/standings/{year}"
-        standings: Standings = {"WEST": [], "EAST": []}
+            response = self.client.get(url)
+            response.raise_for_status()
+
+            return self._parse_page(url, response.text, parse_standings)
 
         try:
-            with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
-                response = client.get(url)
-                response.raise_for_status()
+            return self._cached(self._request_key("GET", url), STANDINGS_URL, fetch)
+
+        except (httpx.HTTPStatusError, httpx.RequestError, Exception):
+            if strict:
+                raise
+
+            return {"WEST": [], "EAST": []}
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop thread that runs the client's leaderboard scrapes."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="cfl-web-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+
+            return self._loop
+
+    def _run_coroutine(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion on the client's background event loop.
+
+        The loop lives as long as the client, so the pooled async client it
+        holds keeps its connections warm between calls. This also works when
+        called from inside another running event loop.
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._background_loop())
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            tables = soup.find_all("table")
+        return future.result()
 
-            if not tables:
-                return standings
+    async def _await_on_background_loop(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Await a coroutine run on the background loop from the caller's loop.
 
-            for i, table in enumerate(tables[:2]):
-                division = "WEST" if i == 0 else "EAST"
-                thead = table.find("thead")  # type: ignore
-                tbody = table.find("tbody")  # type: ignore
+        httpx async clients are bound to the loop they first ran on, so every
+        scrape runs on the one background loop and shares its pooled client,
+        whichever event loop the caller is on.
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._background_loop())
 
-                if not thead or not tbody:
-                    continue
+        return await asyncio.wrap_future(future)
 
-                headers = [th.text.strip() for th in thead.find_all("th")]  # type: ignore
+    async def _web_get_async(self, url: str) -> httpx.Response:
+        """Fetch a cfl.ca page under the web rate limiter, on the background loop.
 
-                for row in tbody.find_all("tr"):  # type: ignore
-                    cells = row.find_all("td")  # type: ignore
-                    if len(cells) != len(headers):
-                        continue  # Skip malformed row
+        Args:
+            url: Page URL
 
-                    team_data: dict[str, str] = {}
-                    for j, cell in enumerate(cells):
-                        text = cell.text.strip()
-                        if j == 1:
-                            team_name_tag = cell.find("a")  # type: ignore
-                            text = team_name_tag.text.strip() if team_name_tag else text  # type: ignore
+        Returns:
+            HTTP response
+        """
+        if self._web_client is None:
+            self._web_client = httpx.AsyncClient(**self._client_options())
 
-                        team_data[headers[j]] = text
+        if self.web_rate_limiter is not None:
+            await self.web_rate_limiter.acquire_async()
 
-                    standings[division].append(cast(StandingsStats, team_data))
+        return await self._web_client.get(url)
 
-        except (httpx.HTTPStatusError, httpx.RequestError, Exception):
-            return standings
+    async def _fetch_leaderboards(self, season: int, strict: bool) -> LeagueLeaders:
+        """Fetch and parse every leaderboard category, on the background loop."""
+        tasks = [
+            self._web_get_async(self._leaderboard_url(category, season))
+            for category in LEADERBOARD_CATEGORIES
+        ]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
 
-        return standings
+        return await self._parse_leaderboards(responses, strict=strict)
 
     async def get_leaderboards_async(
-        self, season: int = DEFAULT_SEASON
+        self, season: int = DEFAULT_SEASON, strict: bool = False
+    ) -> LeagueLeaders:
+        """Get league leaders for all categories asynchronously
+
+        Args:
+            season: Season year (valid options: 2023-2026)
+            strict: Raise on a failed page instead of leaving its category empty
+        """
+        self._check_leaderboard_season(season)
+
+        return await self._await_on_background_loop(
+            self._fetch_leaderboards(season, strict)
+        )
+
+    def get_leaderboards(
+        self, season: int = DEFAULT_SEASON, strict: bool = False
     ) -> LeagueLeaders:
-        """Get league leaders for all categories asynchronously"""
-        if season < MIN_SEASON or season > MAX_SEASON:
-            raise ValueError(f"Season must be between {MIN_SEASON} and {MAX_SEASON}")
+        """Get league leaders for all categories
 
-        result = cast(LeagueLeaders, {OFFENCE: {}, DEFENCE: {}, SPECIAL_TEAMS: {}})
-        categories: list[str] = ["offence", "defence", "special_teams"]
+        Args:
+            season: Season year (valid options: 2023-2026)
+            strict: Raise on a failed page instead of leaving its category empty
+        """
+        self._check_leaderboard_season(season)
+
+        return self._run_coroutine(self._fetch_leaderboards(season, strict))
 
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            tasks = []
+    async def get_leaderboards_by_season_async(
+        self,
+        seasons: Iterable[int] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_players: int = MAX_LEADERBOARD_PLAYERS,
+    ) -> dict[int, LeagueLeaders]:
+        """Get league leaders of many seasons asynchronously over one connection pool.
 
-            for category in categories:
-                url = f"{LEADERBOARD_URL}?stat_category={category}&season={season}"
-                tasks.append(client.get(url, headers=self.headers))
+        Args:
+            seasons: Seasons to fetch (None for every supported season)
+            concurrency: Maximum page requests in flight
+            max_players: Players kept per stat table
 
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
+        Returns:
+            League leaders keyed by season
 
-            for category, response in zip(categories, responses):
-                if isinstance(response, Exception):
-                    continue
+        Raises:
+            ValueError: If any season is outside the supported range
+        """
+        return await self._await_on_background_loop(
+            self._leaderboards_by_season(
+                self._web_get_async,
+                self._leaderboard_seasons(seasons),
+                concurrency,
+                max_players,
+            )
+        )
 
-                # Type guard to ensure response is httpx.Response
-                response = cast(httpx.Response, response)
-                if response.status_code == 200:
-                    category_data = parse_leaderboard_category(response.text, category)
-                    result[category.upper()] = category_data
+    def get_leaderboards_by_season(
+        self,
+        seasons: Iterable[int] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_players: int = MAX_LEADERBOARD_PLAYERS,
+    ) -> dict[int, LeagueLeaders]:
+        """Get league leaders of many seasons in one concurrent call.
 
-        return result
+        Every (season, category) page is fetched over one shared connection
+        pool, and pages are parsed in the parse executor as they arrive.
 
-    def get_leaderboards(self, season: int = DEFAULT_SEASON) -> LeagueLeaders:
-        """Get league leaders for all categories"""
-        try:
-            return asyncio.run(self.get_leaderboards_async(season))
+        Args:
+            seasons: Seasons to fetch (None for every supported season)
+            concurrency: Maximum page requests in flight
+            max_players: Players kept per stat table
 
-        except RuntimeError as e:
-            # Fallback if there's already a running event loop
-            logger.warning("Warning there is already a running event loop %s", e)
-            loop = asyncio.get_event_loop()
+        Returns:
+            League leaders keyed by season
 
-            return loop.run_until_complete(self.get_leaderboards_async(season))
+        Raises:
+            ValueError: If any season is outside the supported range
+        """
+        return self._run_coroutine(
+            self._leaderboards_by_season(
+                self._web_get_async,
+                self._leaderboard_seasons(seasons),
+                concurrency,
+                max_players,
+            )
+        )
@@ -0,0 +1,93 @@
+"""Validator storage for conditional (ETag / Last-Modified) requests."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import httpx
+
+
+class Validated(NamedTuple):
+    """Validators and decoded body from the last successful response"""
+
+    etag: str | None
+    last_modified: str | None
+    body: Any
+    size: int
+
+    def headers(self) -> dict[str, str]:
+        """Build the conditional request headers for these validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class ValidatorStore:
+    """Thread-safe LRU of response validators keyed by request.
+
+    Bounded by entry count and by the total size of the remembered
+    response bodies, measured as their raw byte length.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        """Initialize validator store.
+
+        Args:
+            max_entries: Maximum number of requests to remember
+            max_bytes: Maximum total size of remembered response bodies
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, Validated] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+
+    def get(self, key: str) -> Validated | None:
+        """Get validators for a request key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def store(self, key: str, response: httpx.Response, body: Any) -> None:
+        """Remember the validators of a successful response, if it has any.
+
+        Responses larger than max_bytes are not remembered.
+
+        Args:
+            key: Request key
+            response: Successful HTTP response
+            body: Decoded response body
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        size = len(response.content)
+
+        with self._lock:
+            self._pop(key)
+            if (not etag and not last_modified) or size > self.max_bytes:
+                return
+
+            self._entries[key] = Validated(etag, last_modified, body, size)
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.total_bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Forget all validators."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
@@ -35,10 +35,101 @@ TEAM_STAT_ENDPOINT = "/stats/teamrecords/{team_stats_id}"
 PLAYER_STATS_ENDPOINT = "/stats/playerrecords"
 PLAYER_STAT_ENDPOINT = "/stats/playerrecords/{player_stats_id}"
 PLAYER_PIMS_ENDPOINT = "/stats/playerrecords/pims_player/{player_id}"
+API_ENDPOINTS = [
+    TEAMS_ENDPOINT,
+    TEAM_ENDPOINT,
+    TEAM_ROSTER_ENDPOINT,
+    VENUES_ENDPOINT,
+    VENUE_ENDPOINT,
+    PLAYERS_ENDPOINT,
+    PLAYER_ENDPOINT,
+    PLAYER_LOOKUP_ENDPOINT,
+    PLAYER_POSITIONS_ENDPOINT,
+    SEASONS_ENDPOINT,
+    SEASON_ENDPOINT,
+    FIXTURES_ENDPOINT,
+    FIXTURE_ENDPOINT,
+    SEASON_FIXTURES_ENDPOINT,
+    ROSTERS_ENDPOINT,
+    ROSTER_ENDPOINT,
+    ROSTERS_SUMMARY_ENDPOINT,
+    ROSTER_PLAYERS_ENDPOINT,
+    ROSTER_PLAYER_ENDPOINT,
+    ROSTER_PLAYER_STATES_ENDPOINT,
+    COLLEGES_ENDPOINT,
+    COLLEGE_ENDPOINT,
+    LEDGER_ENDPOINT,
+    TEAM_STATS_ENDPOINT,
+    TEAM_STAT_ENDPOINT,
+    PLAYER_STATS_ENDPOINT,
+    PLAYER_STAT_ENDPOINT,
+    PLAYER_PIMS_ENDPOINT,
+]
 LEADERBOARD_URL = f"{BASE_WEB_URL}/league-leaders"
+STANDINGS_URL = f"{BASE_WEB_URL}/standings/{{year}}"
 
 # Request Configuration
 DEFAULT_TIMEOUT = 30
+DEFAULT_HTTP2 = True
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 15.0
+MAX_CONDITIONAL_ENTRIES = 1024
+MAX_CONDITIONAL_BYTES = 16 * 1024 * 1024
+MAX_PARSED_PAGE_ENTRIES = 256
+
+# Response Cache Configuration (TTLs in seconds)
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SQLITE_TIMEOUT = 30.0
+MAX_NEGATIVE_CACHE_ENTRIES = 4096
+LONG_CACHE_TTL = 24 * 60 * 60
+MEDIUM_CACHE_TTL = 15 * 60
+SHORT_CACHE_TTL = 60
+LIVE_CACHE_TTL = 15
+DEFAULT_CACHE_TTLS = {
+    TEAMS_ENDPOINT: LONG_CACHE_TTL,
+    TEAM_ENDPOINT: LONG_CACHE_TTL,
+    VENUES_ENDPOINT: LONG_CACHE_TTL,
+    VENUE_ENDPOINT: LONG_CACHE_TTL,
+    PLAYER_POSITIONS_ENDPOINT: LONG_CACHE_TTL,
+    ROSTER_PLAYER_STATES_ENDPOINT: LONG_CACHE_TTL,
+    COLLEGES_ENDPOINT: LONG_CACHE_TTL,
+    COLLEGE_ENDPOINT: LONG_CACHE_TTL,
+    SEASONS_ENDPOINT: LONG_CACHE_TTL,
+    SEASON_ENDPOINT: LONG_CACHE_TTL,
+    PLAYERS_ENDPOINT: MEDIUM_CACHE_TTL,
+    PLAYER_ENDPOINT: MEDIUM_CACHE_TTL,
+    PLAYER_LOOKUP_ENDPOINT: MEDIUM_CACHE_TTL,
+    FIXTURES_ENDPOINT: MEDIUM_CACHE_TTL,
+    FIXTURE_ENDPOINT: MEDIUM_CACHE_TTL,
+    SEASON_FIXTURES_ENDPOINT: MEDIUM_CACHE_TTL,
+    TEAM_STATS_ENDPOINT: MEDIUM_CACHE_TTL,
+    TEAM_STAT_ENDPOINT: MEDIUM_CACHE_TTL,
+    PLAYER_STATS_ENDPOINT: MEDIUM_CACHE_TTL,
+    PLAYER_STAT_ENDPOINT: MEDIUM_CACHE_TTL,
+    PLAYER_PIMS_ENDPOINT: MEDIUM_CACHE_TTL,
+    TEAM_ROSTER_ENDPOINT: SHORT_CACHE_TTL,
+    ROSTERS_ENDPOINT: SHORT_CACHE_TTL,
+    ROSTER_ENDPOINT: SHORT_CACHE_TTL,
+    ROSTERS_SUMMARY_ENDPOINT: SHORT_CACHE_TTL,
+    ROSTER_PLAYERS_ENDPOINT: SHORT_CACHE_TTL,
+    ROSTER_PLAYER_ENDPOINT: SHORT_CACHE_TTL,
+    LEDGER_ENDPOINT: SHORT_CACHE_TTL,
+    STANDINGS_URL: MEDIUM_CACHE_TTL,
+}
+# TTLs used instead of the defaults while games are in progress
+LIVE_CACHE_TTLS = {
+    FIXTURES_ENDPOINT: LIVE_CACHE_TTL,
+    FIXTURE_ENDPOINT: LIVE_CACHE_TTL,
+    SEASON_FIXTURES_ENDPOINT: LIVE_CACHE_TTL,
+    TEAM_STATS_ENDPOINT: SHORT_CACHE_TTL,
+    TEAM_STAT_ENDPOINT: SHORT_CACHE_TTL,
+    PLAYER_STATS_ENDPOINT: SHORT_CACHE_TTL,
+    PLAYER_STAT_ENDPOINT: SHORT_CACHE_TTL,
+    PLAYER_PIMS_ENDPOINT: SHORT_CACHE_TTL,
+    STANDINGS_URL: SHORT_CACHE_TTL,
+}
 DEFAULT_HEADERS = {
     "Referer": "https://www.cfl.ca/",
     "Accept": "application/json, text/javascript, */*; q=0.01",
@@ -54,6 +145,13 @@ USER_AGENTS = [
 DEFAULT_SEASON = 2026
 DEFAULT_LIMIT = 100
 DEFAULT_PAGE = 1
+DEFAULT_CONCURRENCY = 8
+RELATION_FOREIGN_KEYS = {
+    "venue": "venue_id",
+    "season": "season_id",
+    "player": "player_id",
+    "college": "college_id",
+}
 MIN_SEASON = 2023
 MAX_SEASON = 2026
 MAX_LEADERBOARD_PLAYERS = 10
@@ -62,6 +160,7 @@ MAX_LEADERBOARD_PLAYERS = 10
 OFFENCE = "OFFENCE"
 DEFENCE = "DEFENCE"
 SPECIAL_TEAMS = "SPECIAL_TEAMS"
+LEADERBOARD_CATEGORIES = ["offence", "defence", "special_teams"]
 
 
 def get_random_user_agent() -> str:
@@ -0,0 +1,81 @@
+"""JSON decoding backends for API responses."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    decoder = msgspec.json.Decoder()
+
+    def decode(content: bytes) -> Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return decode
+
+
+def json_default(value: Any) -> Any:
+    """Serialize values the json module cannot: msgspec Structs as builtins, others as str."""
+    if msgspec is not None and isinstance(value, msgspec.Struct):
+        return msgspec.to_builtins(value)
+
+    return str(value)
+
+
+def available_decoders() -> list[str]:
+    """Names of the installed JSON decoders, fastest first."""
+    names = []
+    if orjson is not None:
+        names.append("orjson")
+    if msgspec is not None:
+        names.append("msgspec")
+    names.append("json")
+
+    return names
+
+
+def get_json_decoder(decoder: str | JSONDecoder | None = None) -> JSONDecoder:
+    """Resolve a JSON decoder that parses response bytes directly.
+
+    Args:
+        decoder: "orjson", "msgspec", "json", a callable taking bytes, or None
+            for the fastest installed backend
+
+    Returns:
+        Function decoding bytes to Python objects, raising ValueError on
+        invalid JSON
+
+    Raises:
+        ValueError: If the named decoder is unknown or not installed
+    """
+    if callable(decoder):
+        return decoder
+
+    name = decoder or available_decoders()[0]
+    if name not in available_decoders():
+        raise ValueError(
+            f"JSON decoder {name!r} is not available. "
+            f"Valid options: {available_decoders()}"
+        )
+
+    if name == "orjson":
+        return orjson.loads
+    if name == "msgspec":
+        return _msgspec_decoder()
+
+    return json.loads
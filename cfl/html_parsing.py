@@ -0,0 +1,117 @@
+"""HTML parser backend for the cfl.ca standings and leaderboard scrapes."""
+
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+_TABLES = SoupStrainer("table")
+
+
+def parse_tables(html_content: str | bytes, parser: str | None = None) -> list[Tag]:
+    """Parse only the <table> subtrees of a page.
+
+    Everything outside tables (navigation, scripts, article markup) is
+    skipped while parsing instead of being built into the tree.
+
+    Args:
+        html_content: Page HTML
+        parser: BeautifulSoup tree builder ("lxml", "html.parser"), defaults to
+            lxml when installed
+
+    Returns:
+        Tables in document order
+    """
+    soup = BeautifulSoup(html_content, parser or HTML_PARSER, parse_only=_TABLES)
+
+    return soup.find_all("table")  # type: ignore
+
+
+def table_region(html_content: str) -> str:
+    """Slice a page from its first <table> to the end of its last </table>.
+
+    Returns the whole page if it has no tables.
+    """
+    start = html_content.find("<table")
+    end = html_content.rfind("</table>")
+    if start == -1 or end < start:
+        return html_content
+
+    return html_content[start : end + len("</table>")]
+
+
+class ParsedPageStore:
+    """Thread-safe LRU of parsed pages, reused while their tables are unchanged.
+
+    Entries are keyed by request (e.g. URL) and hold a hash of the page's
+    table region, so page chrome that changes on every request (ads,
+    nonces, timestamps) does not force a re-parse. ``hits`` and ``misses``
+    count lookups that did and did not skip parsing.
+    """
+
+    def __init__(self, max_entries: int):
+        """Initialize parsed page store.
+
+        Args:
+            max_entries: Maximum number of pages to remember
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(html_content: str) -> str:
+        """Hash the table region of a page."""
+        region = table_region(html_content).encode("utf-8", "surrogatepass")
+
+        return hashlib.blake2b(region, digest_size=16).hexdigest()
+
+    def get(self, key: Hashable, digest: str) -> Any | None:
+        """Get the parsed page for a key if its table region hash still matches.
+
+        Args:
+            key: Request key
+            digest: Hash of the freshly fetched page
+
+        Returns:
+            Previously parsed value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != digest:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[1]
+
+    def store(self, key: Hashable, digest: str, parsed: Any) -> None:
+        """Remember the parsed value of a page.
+
+        Args:
+            key: Request key
+            digest: Hash of the page's table region
+            parsed: Parsed value
+        """
+        with self._lock:
+            self._entries[key] = (digest, parsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all parsed pages and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
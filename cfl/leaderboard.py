@@ -1,8 +1,7 @@
 """Utils for getting leaderboard data"""
 
-from bs4 import BeautifulSoup, Tag
-
 from .constants import MAX_LEADERBOARD_PLAYERS
+from .html_parsing import parse_tables
 from .types import _PlayerStat
 
 STAT_CATEGORY_MAPPING = {
@@ -138,10 +137,12 @@ def parse_player_table(
 
 
 def parse_leaderboard_category(
-    html_content: str, category: str
+    html_content: str,
+    category: str,
+    parser: str | None = None,
+    max_players: int = MAX_LEADERBOARD_PLAYERS,
 ) -> dict[str, list[_PlayerStat]]:
-    soup = BeautifulSoup(html_content, "html.parser")
-    tables: list[Tag] = soup.find_all("table")  # type: ignore
+    tables = parse_tables(html_content, parser)
 
     category_results = DEFAULT_CATEGORIES.get(category, {}).copy()
     category_mapping = STAT_CATEGORY_MAPPING.get(category, {})
@@ -155,7 +156,7 @@ def parse_leaderboard_category(
 
         for key, value in category_mapping.items():
             if header_text == key:
-                category_results[value] = parse_player_table(table)
+                category_results[value] = parse_player_table(table, max_players)
                 break
 
     return category_results
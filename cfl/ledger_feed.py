@@ -0,0 +1,106 @@
+"""Change feed over the yearly player transaction ledger."""
+
+from collections.abc import Iterable
+
+from .types import LedgerTransaction
+
+
+class LedgerFeed:
+    """Yield only ledger transactions not seen by earlier polls.
+
+    The feed keeps a high-water mark on transaction_id and distributed_at.
+    A transaction is new if its ID is above the mark, or if it was
+    distributed at or after the newest distributed_at seen and its ID is not
+    in the seen-set. The seen-set only holds IDs distributed at exactly that
+    newest timestamp, so it stays a handful of entries however long the
+    ledger grows. distributed_at values are compared as strings, which
+    orders correctly for the API's fixed-width timestamp format.
+
+    To resume after a restart, pass the saved transaction_id, distributed_at
+    and seen_ids back in. Without seen_ids, transactions distributed at
+    exactly the saved distributed_at are treated as seen if their ID is at
+    or below the saved transaction_id.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        transaction_id: int | None = None,
+        distributed_at: str | None = None,
+        seen_ids: Iterable[int] | None = None,
+    ):
+        """Initialize ledger feed.
+
+        Args:
+            year: Ledger year to follow (e.g., 2026)
+            transaction_id: Resume after this transaction ID
+            distributed_at: Resume after this distribution time
+            seen_ids: Saved seen_ids of the feed being resumed
+        """
+        self.year = year
+        self.transaction_id = transaction_id
+        self.distributed_at = distributed_at
+        self._seen: set[int] = set(seen_ids or ())
+        # Resumed without its seen-set: fall back to the ID mark at distributed_at
+        self._seen_unknown = seen_ids is None and distributed_at is not None
+
+    @property
+    def seen_ids(self) -> list[int]:
+        """IDs already yielded at the current distributed_at, to save for resuming."""
+        return sorted(self._seen)
+
+    def _is_new(self, transaction: LedgerTransaction) -> bool:
+        transaction_id = transaction["transaction_id"]
+        if transaction_id in self._seen:
+            return False
+        if self.transaction_id is None or transaction_id > self.transaction_id:
+            return True
+
+        if self.distributed_at is None:
+            return False
+
+        distributed_at = transaction["distributed_at"]
+        if distributed_at == self.distributed_at and self._seen_unknown:
+            return False
+
+        return distributed_at >= self.distributed_at
+
+    def diff(self, transactions: list[LedgerTransaction]) -> list[LedgerTransaction]:
+        """Get the transactions not seen before and advance the high-water mark.
+
+        Args:
+            transactions: Full ledger as returned by get_ledger
+
+        Returns:
+            New transactions, oldest distributed first
+        """
+        new = [t for t in transactions if self._is_new(t)]
+        if not new:
+            return []
+
+        new.sort(key=lambda t: (t["distributed_at"], t["transaction_id"]))
+
+        newest_at = new[-1]["distributed_at"]
+        if self.distributed_at is None or newest_at > self.distributed_at:
+            self.distributed_at = newest_at
+            self._seen = set()
+            self._seen_unknown = False
+
+        self._seen.update(
+            t["transaction_id"]
+            for t in new
+            if t["distributed_at"] == self.distributed_at
+        )
+        self.transaction_id = max(
+            self.transaction_id or 0, max(t["transaction_id"] for t in new)
+        )
+
+        return new
+
+    def poll(self, client) -> list[LedgerTransaction]:
+        """Fetch the ledger with a CFLClient and get the new transactions."""
+        return self.diff(client.get_ledger(self.year))
+
+    async def poll_async(self, client) -> list[LedgerTransaction]:
+        """Fetch the ledger with an AsyncCFLClient and get the new transactions."""
+        return self.diff(await client.get_ledger(self.year))
@@ -0,0 +1,64 @@
+"""Client-side token bucket rate limiting."""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from sync code and any event loop.
+
+    Callers reserve a token up front and sleep off any deficit outside the
+    lock, so one bucket can be shared by a CFLClient, an AsyncCFLClient and
+    worker threads while still enforcing a single combined rate.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size, defaults to one second worth of tokens
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds the caller must wait before the reservation is honoured
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until tokens are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Wait without blocking the event loop until tokens are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,138 @@
+"""Retry policy for transient CFL API failures."""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+# Retries allowed per HTTP status code
+DEFAULT_STATUS_RETRIES = {429: 5, 502: 3, 503: 3, 504: 3}
+
+# Retries allowed per exception type (matched with isinstance)
+DEFAULT_EXCEPTION_RETRIES = {
+    httpx.ConnectError: 3,
+    httpx.TimeoutException: 2,
+    httpx.RemoteProtocolError: 2,
+}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Decide whether and when a failed request should be retried.
+
+    Attributes:
+        status_retries: Maximum retries per HTTP status code
+        exception_retries: Maximum retries per transport exception type
+        backoff_factor: Base delay in seconds, doubled on every retry
+        max_backoff: Upper bound for a single computed delay
+        jitter: Randomize delays ("full jitter") to avoid synchronized retries
+        respect_retry_after: Honour the Retry-After header on 429/503 responses
+        max_total_time: Give up once this many seconds have elapsed (None for no limit)
+        methods: HTTP methods that are safe to retry
+    """
+
+    status_retries: dict[int, int] = field(
+        default_factory=lambda: dict(DEFAULT_STATUS_RETRIES)
+    )
+    exception_retries: dict[type[Exception], int] = field(
+        default_factory=lambda: dict(DEFAULT_EXCEPTION_RETRIES)
+    )
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_total_time: float | None = 60.0
+    methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def _max_retries(
+        self,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> int:
+        if response is not None:
+            return self.status_retries.get(response.status_code, 0)
+
+        for exc_type, retries in self.exception_retries.items():
+            if isinstance(error, exc_type):
+                return retries
+
+        return 0
+
+    def backoff(self, retries: int) -> float:
+        """Compute the exponential backoff delay before a retry.
+
+        Args:
+            retries: Number of retries already performed
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2**retries))
+
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def next_delay(
+        self,
+        method: str,
+        retries: int,
+        elapsed: float,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Get the delay before the next attempt.
+
+        Args:
+            method: HTTP method of the request
+            retries: Number of retries already performed
+            elapsed: Seconds since the first attempt started
+            response: Response of the failed attempt, if any
+            error: Transport exception of the failed attempt, if any
+
+        Returns:
+            Seconds to wait before retrying, or None to stop retrying
+        """
+        if method.upper() not in self.methods:
+            return None
+
+        if retries >= self._max_retries(response, error):
+            return None
+
+        delay = self.backoff(retries)
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+
+        if self.max_total_time is not None and elapsed + delay > self.max_total_time:
+            return None
+
+        return delay
@@ -0,0 +1,168 @@
+"""Season snapshots combining every per-season dataset in one object."""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import TypeVar
+
+from .async_client import AsyncCFLClient
+from .constants import DEFAULT_CONCURRENCY, MAX_SEASON, MIN_SEASON
+from .decoding import json_default
+from .types import (
+    Fixture,
+    LeagueLeaders,
+    LedgerTransaction,
+    PlayerStats,
+    Roster,
+    Season,
+    Standings,
+    TeamStats,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SeasonSnapshot:
+    """Every dataset of a season, fetched in a single run.
+
+    Attributes:
+        season: Season details
+        fixtures: Every fixture of the season
+        team_stats: Cumulative team statistics
+        player_stats: Every page of cumulative player statistics
+        rosters: Current rosters
+        ledger: Player transactions for the season year
+        standings: Standings, or None for years cfl.ca does not serve
+        leaderboards: League leaders, or None for years cfl.ca does not serve
+        created_at: UTC time the snapshot was started (ISO 8601)
+        timings: Seconds spent in each stage, plus "total"
+    """
+
+    season: Season
+    fixtures: list[Fixture]
+    team_stats: list[TeamStats]
+    player_stats: list[PlayerStats]
+    rosters: list[Roster]
+    ledger: list[LedgerTransaction]
+    standings: Standings | None
+    leaderboards: LeagueLeaders | None
+    created_at: str
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Convert the snapshot to plain JSON-serializable data."""
+        return asdict(self)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the snapshot to a JSON file, replacing it atomically."""
+        path = os.path.expanduser(os.fspath(path))
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, default=json_default)
+
+        os.replace(tmp_path, path)
+
+
+async def _none() -> None:
+    return None
+
+
+async def build_season_snapshot(
+    client: AsyncCFLClient,
+    season_id: int,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> SeasonSnapshot:
+    """Fetch a whole season concurrently.
+
+    The season is fetched first, because the ledger, standings and
+    leaderboards are keyed by its year. Every other stage then runs at
+    once. Paginated stages also fetch their pages concurrently. A failing
+    stage fails the whole snapshot, so a snapshot is never partial; the
+    standings and leaderboards are fetched with strict=True so a failed
+    cfl.ca page raises instead of coming back empty.
+
+    Args:
+        client: Async client to fetch with
+        season_id: Season ID
+        concurrency: Maximum pages in flight per paginated stage
+
+    Returns:
+        Season snapshot with per-stage timings
+    """
+    created_at = datetime.now(timezone.utc).isoformat()
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
+
+    async def timed(stage: str, awaitable: Awaitable[T]) -> T:
+        stage_started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            timings[stage] = time.perf_counter() - stage_started
+
+    season = await timed("season", client.get_season(season_id))
+    year = season["year"]
+    on_web = MIN_SEASON <= year <= MAX_SEASON
+
+    tasks = [
+        asyncio.ensure_future(timed(stage, awaitable))
+        for stage, awaitable in (
+            (
+                "fixtures",
+                client.get_all_fixtures(season_id=season_id, concurrency=concurrency),
+            ),
+            ("team_stats", client.get_team_stats(season_id=season_id)),
+            (
+                "player_stats",
+                client.get_all_player_stats(
+                    season_id=season_id, concurrency=concurrency
+                ),
+            ),
+            ("rosters", client.get_rosters()),
+            ("ledger", client.get_ledger(year)),
+            (
+                "standings",
+                client.get_standings(year, strict=True) if on_web else _none(),
+            ),
+            (
+                "leaderboards",
+                client.get_leaderboards(year, strict=True) if on_web else _none(),
+            ),
+        )
+    ]
+
+    try:
+        (
+            fixtures,
+            team_stats,
+            player_stats,
+            rosters,
+            ledger,
+            standings,
+            leaderboards,
+        ) = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    timings["total"] = time.perf_counter() - started
+
+    return SeasonSnapshot(
+        season=season,
+        fixtures=fixtures,
+        team_stats=team_stats,
+        player_stats=player_stats,
+        rosters=rosters,
+        ledger=ledger,
+        standings=standings,
+        leaderboards=leaderboards,
+        created_at=created_at,
+        timings=timings,
+    )
@@ -0,0 +1,41 @@
+"""Utils for getting standings data"""
+
+from typing import cast
+
+from .html_parsing import parse_tables
+from .types import Standings, StandingsStats
+
+DIVISIONS = ("WEST", "EAST")
+
+
+def parse_standings(html_content: str, parser: str | None = None) -> Standings:
+    standings: Standings = {"WEST": [], "EAST": []}
+
+    tables = parse_tables(html_content, parser)
+
+    for division, table in zip(DIVISIONS, tables):
+        thead = table.find("thead")  # type: ignore
+        tbody = table.find("tbody")  # type: ignore
+
+        if not thead or not tbody:
+            continue
+
+        headers = [th.text.strip() for th in thead.find_all("th")]  # type: ignore
+
+        for row in tbody.find_all("tr"):  # type: ignore
+            cells = row.find_all("td")  # type: ignore
+            if len(cells) != len(headers):
+                continue  # Skip malformed row
+
+            team_data: dict[str, str] = {}
+            for j, cell in enumerate(cells):
+                text = cell.text.strip()
+                if j == 1:
+                    team_name_tag = cell.find("a")  # type: ignore
+                    text = team_name_tag.text.strip() if team_name_tag else text  # type: ignore
+
+                team_data[headers[j]] = text
+
+            standings[division].append(cast(StandingsStats, team_data))
+
+    return standings
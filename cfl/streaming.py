@@ -0,0 +1,159 @@
+"""Incremental parsing of JSON array responses, one item at a time."""
+
+import codecs
+import json
+from typing import Any
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_WHITESPACE = " \t\n\r"
+
+
+class _SplitParser:
+    """Pure-Python fallback that splits a JSON array into its elements.
+
+    Complete elements are decoded with json.JSONDecoder.raw_decode as soon as
+    they are buffered, and the consumed text is dropped, so the buffer never
+    holds much more than one element.
+    """
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = "start"
+
+    @staticmethod
+    def _skip(buffer: str, pos: int, separators: str = _WHITESPACE) -> int:
+        while pos < len(buffer) and buffer[pos] in separators:
+            pos += 1
+
+        return pos
+
+    def _drain(self, final: bool) -> list:
+        buffer = self._buffer
+        pos = self._skip(buffer, 0)
+        items = []
+
+        if self._state == "start" and pos < len(buffer):
+            if buffer[pos] == "[":
+                self._state = "array"
+                pos += 1
+            else:
+                # Not an array: the whole body is one value, decoded on close
+                self._state = "value"
+
+        while self._state == "array":
+            pos = self._skip(buffer, pos, _WHITESPACE + ",")
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._state = "done"
+                pos += 1
+                break
+
+            try:
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+
+            # A number cut off mid-chunk (e.g. "7." of "7.5") decodes early, so
+            # only accept an element once the separator after it has arrived
+            if end >= len(buffer) or buffer[end] not in _WHITESPACE + ",]":
+                if final:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+                break
+
+            items.append(value)
+            pos = end
+
+        if self._state != "value":
+            self._buffer = buffer[pos:]
+
+        return items
+
+    def feed(self, chunk: bytes) -> list:
+        self._buffer += self._text.decode(chunk)
+
+        return self._drain(final=False)
+
+    def close(self) -> list:
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain(final=True)
+
+        if self._state == "value":
+            return [json.loads(self._buffer)]
+        if self._state == "start":
+            raise json.JSONDecodeError("Empty response", self._buffer, 0)
+        if self._state == "array":
+            raise json.JSONDecodeError("Unterminated array", self._buffer, 0)
+
+        return items
+
+
+class _IjsonParser:
+    """Event parser backed by ijson, yielding array items (or a lone object)."""
+
+    def __init__(self):
+        self._items = ijson.sendable_list()
+        self._coro = None
+        self._pending = b""
+
+    def _start(self, chunk: bytes) -> None:
+        self._pending += chunk
+        body = self._pending.lstrip()
+        if not body:
+            return
+
+        prefix = "item" if body[:1] == b"[" else ""
+        self._coro = ijson.items_coro(self._items, prefix, use_float=True)
+        self._coro.send(self._pending)
+        self._pending = b""
+
+    def _take(self) -> list:
+        items = list(self._items)
+        del self._items[:]
+
+        return items
+
+    def feed(self, chunk: bytes) -> list:
+        try:
+            if self._coro is None:
+                self._start(chunk)
+            else:
+                self._coro.send(chunk)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+
+        return self._take()
+
+    def close(self) -> list:
+        if self._coro is None:
+            raise json.JSONDecodeError("Empty response", "", 0)
+
+        try:
+            self._coro.close()
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+
+        return self._take()
+
+
+def json_stream_parser() -> Any:
+    """Create an incremental parser for a JSON array response body.
+
+    Feed it raw response chunks with ``feed(chunk)``; each call returns the
+    items completed so far. ``close()`` returns any remaining items and
+    raises ValueError if the body was truncated. A body that is a single
+    object rather than an array is returned as one item. Uses ijson when
+    installed and a pure-Python splitter otherwise.
+    """
+    if ijson is not None:
+        return _IjsonParser()
+
+    return _SplitParser()
@@ -0,0 +1,286 @@
+"""Compact msgspec Struct mirrors of the response types in cfl.types.
+
+Every TypedDict in cfl.types has a Struct of the same name here, generated
+from its type hints. Fields a TypedDict marks as not required default to
+None and datetimes are kept as the API's timestamp strings. The Structs
+also support dict-style reads (``stats["player_id"]``, ``stats.get(...)``)
+so code written against the TypedDicts keeps working.
+
+Requires msgspec (``pip install "cfl-sdk[msgspec]"``).
+"""
+
+from datetime import datetime
+from types import UnionType
+from typing import (
+    Any,
+    ForwardRef,
+    NotRequired,
+    Required,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+try:
+    import msgspec
+except ImportError as e:
+    raise ImportError(
+        'Struct decoding requires msgspec: pip install "cfl-sdk[msgspec]"'
+    ) from e
+
+from . import types as cfl_types
+from .constants import (
+    COLLEGE_ENDPOINT,
+    COLLEGES_ENDPOINT,
+    FIXTURE_ENDPOINT,
+    FIXTURES_ENDPOINT,
+    LEDGER_ENDPOINT,
+    PLAYER_ENDPOINT,
+    PLAYER_LOOKUP_ENDPOINT,
+    PLAYER_PIMS_ENDPOINT,
+    PLAYER_POSITIONS_ENDPOINT,
+    PLAYER_STAT_ENDPOINT,
+    PLAYER_STATS_ENDPOINT,
+    PLAYERS_ENDPOINT,
+    ROSTER_ENDPOINT,
+    ROSTER_PLAYER_ENDPOINT,
+    ROSTER_PLAYER_STATES_ENDPOINT,
+    ROSTER_PLAYERS_ENDPOINT,
+    ROSTERS_ENDPOINT,
+    ROSTERS_SUMMARY_ENDPOINT,
+    SEASON_ENDPOINT,
+    SEASON_FIXTURES_ENDPOINT,
+    SEASONS_ENDPOINT,
+    TEAM_ENDPOINT,
+    TEAM_ROSTER_ENDPOINT,
+    TEAM_STAT_ENDPOINT,
+    TEAM_STATS_ENDPOINT,
+    TEAMS_ENDPOINT,
+    VENUE_ENDPOINT,
+    VENUES_ENDPOINT,
+)
+from .exceptions import CFLAPIResponseError
+
+
+class Record(msgspec.Struct, kw_only=True, omit_defaults=True, gc=False):
+    """Base class of the generated Structs, readable like the dicts they replace"""
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__struct_fields__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def keys(self) -> tuple[str, ...]:
+        return self.__struct_fields__
+
+    def set_fields(self) -> dict[str, Any]:
+        """Fields that are set, as the dict the API response would decode to"""
+        return {
+            key: value
+            for key in self.__struct_fields__
+            if (value := getattr(self, key)) is not None
+        }
+
+    def with_relations(self, relations: dict[str, Any]) -> Any:
+        """Copy the record with entities merged into its relations.
+
+        Records whose type has no Relations Struct holding every given name
+        (e.g. PlayerStats) come back as a dict of their set fields instead.
+        """
+        relations_type = STRUCTS.get(f"{type(self).__name__}Relations")
+        if relations_type is not None and all(
+            name in relations_type.__struct_fields__ for name in relations
+        ):
+            current = self.get("relations") or relations_type()
+            return msgspec.structs.replace(
+                self, relations=msgspec.structs.replace(current, **relations)
+            )
+
+        fields = self.set_fields()
+        current = fields.get("relations")
+        if isinstance(current, Record):
+            current = current.set_fields()
+
+        return {**fields, "relations": {**(current or {}), **relations}}
+
+
+def _struct_type(hint: Any) -> Any:
+    """Map a TypedDict field hint to the equivalent Struct field type."""
+    origin = get_origin(hint)
+    args = get_args(hint)
+
+    if origin in (Required, NotRequired):
+        return _struct_type(args[0])
+    if hint is datetime:
+        return str
+    if is_typeddict(hint):
+        # Forward reference so nested and self-referencing types resolve lazily
+        return ForwardRef(hint.__name__)
+    if origin is list:
+        return list[_struct_type(args[0])]
+    if origin in (Union, UnionType):
+        return Union[tuple(_struct_type(arg) for arg in args)]
+
+    return hint
+
+
+def _define(typed_dict: type) -> type:
+    hints = get_type_hints(typed_dict, include_extras=True)
+    fields = []
+
+    for name, hint in hints.items():
+        field_type = _struct_type(hint)
+        if name in typed_dict.__required_keys__:
+            fields.append((name, field_type))
+        else:
+            fields.append((name, Union[field_type, None], None))
+
+    return msgspec.defstruct(
+        typed_dict.__name__,
+        fields,
+        bases=(Record,),
+        module=__name__,
+        kw_only=True,
+        omit_defaults=True,
+        gc=False,
+    )
+
+
+STRUCTS: dict[str, type] = {
+    name: _define(value)
+    for name, value in vars(cfl_types).items()
+    if is_typeddict(value) and value.__module__ == cfl_types.__name__
+}
+
+# Forward references between Structs resolve through this module's namespace
+globals().update(STRUCTS)
+
+College = STRUCTS["College"]
+Fixture = STRUCTS["Fixture"]
+LedgerTransaction = STRUCTS["LedgerTransaction"]
+Player = STRUCTS["Player"]
+PlayerLookup = STRUCTS["PlayerLookup"]
+PlayerPosition = STRUCTS["PlayerPosition"]
+PlayerStats = STRUCTS["PlayerStats"]
+Roster = STRUCTS["Roster"]
+RosterPlayer = STRUCTS["RosterPlayer"]
+RosterPlayerState = STRUCTS["RosterPlayerState"]
+RosterSummary = STRUCTS["RosterSummary"]
+Season = STRUCTS["Season"]
+Team = STRUCTS["Team"]
+TeamStats = STRUCTS["TeamStats"]
+Venue = STRUCTS["Venue"]
+
+RESPONSE_TYPES: dict[str, Any] = {
+    TEAMS_ENDPOINT: list[Team],
+    TEAM_ENDPOINT: Team,
+    TEAM_ROSTER_ENDPOINT: Roster,
+    VENUES_ENDPOINT: list[Venue],
+    VENUE_ENDPOINT: Venue,
+    PLAYERS_ENDPOINT: list[Player],
+    PLAYER_ENDPOINT: Player,
+    PLAYER_LOOKUP_ENDPOINT: list[PlayerLookup],
+    PLAYER_POSITIONS_ENDPOINT: list[PlayerPosition],
+    SEASONS_ENDPOINT: list[Season],
+    SEASON_ENDPOINT: Season,
+    FIXTURES_ENDPOINT: list[Fixture],
+    FIXTURE_ENDPOINT: Fixture,
+    SEASON_FIXTURES_ENDPOINT: list[Fixture],
+    ROSTERS_ENDPOINT: list[Roster],
+    ROSTER_ENDPOINT: Roster,
+    ROSTERS_SUMMARY_ENDPOINT: list[RosterSummary],
+    ROSTER_PLAYERS_ENDPOINT: list[RosterPlayer],
+    ROSTER_PLAYER_ENDPOINT: RosterPlayer,
+    ROSTER_PLAYER_STATES_ENDPOINT: list[RosterPlayerState],
+    COLLEGES_ENDPOINT: list[College],
+    COLLEGE_ENDPOINT: College,
+    LEDGER_ENDPOINT: list[LedgerTransaction],
+    TEAM_STATS_ENDPOINT: list[TeamStats],
+    TEAM_STAT_ENDPOINT: TeamStats,
+    PLAYER_STATS_ENDPOINT: list[PlayerStats],
+    PLAYER_STAT_ENDPOINT: PlayerStats,
+    PLAYER_PIMS_ENDPOINT: PlayerStats,
+}
+
+
+class StructDecoder:
+    """Decode API responses straight from bytes into validated Structs."""
+
+    def __init__(self):
+        self._decoders: dict[str, msgspec.json.Decoder] = {}
+        self._fallback = msgspec.json.Decoder()
+
+    def _decoder(self, template: str | None) -> msgspec.json.Decoder:
+        response_type = RESPONSE_TYPES.get(template)
+        if response_type is None:
+            return self._fallback
+
+        decoder = self._decoders.get(template)
+        if decoder is None:
+            decoder = self._decoders[template] = msgspec.json.Decoder(
+                response_type, strict=False
+            )
+
+        return decoder
+
+    def decode(self, response, template: str | None) -> Any:
+        """Decode a response into the Struct type of its endpoint.
+
+        Args:
+            response: Successful HTTP response
+            template: Endpoint template the response came from
+
+        Returns:
+            Structs for known endpoints, plain JSON data otherwise
+
+        Raises:
+            CFLAPIResponseError: If the body does not match the endpoint's type
+            ValueError: If the body is not valid JSON
+        """
+        try:
+            return self._decoder(template).decode(response.content)
+        except msgspec.ValidationError as e:
+            raise CFLAPIResponseError(
+                response.status_code, f"Unexpected response shape: {e}"
+            ) from e
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def convert(self, value: Any, template: str | None) -> Any:
+        """Convert plain JSON data (e.g. from a disk cache) into Structs."""
+        response_type = RESPONSE_TYPES.get(template)
+        if response_type is None:
+            return value
+
+        first = value[0] if isinstance(value, list) and value else value
+        if not isinstance(first, dict):
+            return value
+
+        return msgspec.convert(value, response_type, strict=False)
+
+    def convert_item(self, value: Any, template: str | None) -> Any:
+        """Convert one element of a list response (e.g. when streaming) into its Struct.
+
+        Raises:
+            CFLAPIResponseError: If the element does not match the endpoint's type
+        """
+        response_type = RESPONSE_TYPES.get(template)
+        if get_origin(response_type) is not list:
+            return value
+
+        try:
+            return msgspec.convert(value, get_args(response_type)[0], strict=False)
+        except msgspec.ValidationError as e:
+            raise CFLAPIResponseError(200, f"Unexpected response shape: {e}") from e
@@ -0,0 +1,193 @@
+"""Incremental sync of API entities using metadata revisions."""
+
+import json
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, NamedTuple
+
+INSERTED = "inserted"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+def _revision_time(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+class SyncChange(NamedTuple):
+    """Change to a single entity found by a sync run"""
+
+    kind: str
+    id: int
+    record: dict | None
+
+
+@dataclass
+class SyncState:
+    """Last-seen revision per entity ID and the newest revision_at seen.
+
+    Attributes:
+        revisions: metadata.revision keyed by entity ID
+        watermark: Newest metadata.revision_at from the last completed run
+    """
+
+    revisions: dict[int, int | None] = field(default_factory=dict)
+    watermark: str | None = None
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "SyncState":
+        """Load state saved by save(), or empty state if the file is missing."""
+        path = os.path.expanduser(os.fspath(path))
+        if not os.path.exists(path):
+            return cls()
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        revisions = {int(key): value for key, value in data["revisions"].items()}
+
+        return cls(revisions, data.get("watermark"))
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write state to a JSON file."""
+        path = os.path.expanduser(os.fspath(path))
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"revisions": self.revisions, "watermark": self.watermark}, f)
+
+        os.replace(tmp_path, path)
+
+
+class IncrementalSync:
+    """Emit only the entities that changed since the previous run.
+
+    Feed a run with an entity iterator such as ``client.iter_players()``.
+    When the listing is sorted newest revision_at first (``ordered=True``),
+    the run stops at the first entity older than the previous run's
+    watermark, so later pages are never fetched. Deletions can only be seen
+    on a full pass, so they are emitted only when the listing was read to
+    the end.
+    """
+
+    def __init__(self, state: SyncState | None = None):
+        """Initialize incremental sync.
+
+        Args:
+            state: State from a previous run (e.g. SyncState.load(path))
+        """
+        self.state = state if state is not None else SyncState()
+        self._seen: set[int] = set()
+        self._newest: datetime | None = None
+
+    def _start(self) -> datetime | None:
+        self._seen = set()
+        self._newest = None
+
+        if self.state.watermark is None:
+            return None
+
+        return _revision_time(self.state.watermark)
+
+    def _past_watermark(
+        self, item: dict, ordered: bool, watermark: datetime | None
+    ) -> bool:
+        """Track the newest revision_at and tell whether an ordered run can stop."""
+        revision_at = (item.get("metadata") or {}).get("revision_at")
+        if revision_at is None:
+            return False
+
+        revised = _revision_time(revision_at)
+        if ordered and watermark is not None and revised < watermark:
+            return True
+
+        if self._newest is None or revised > self._newest:
+            self._newest = revised
+
+        return False
+
+    def _compare(self, item: dict) -> SyncChange | None:
+        """Record one entity's revision and get its change, if any."""
+        item_id = item["ID"]
+        self._seen.add(item_id)
+        revision = (item.get("metadata") or {}).get("revision")
+
+        if item_id not in self.state.revisions:
+            kind = INSERTED
+        elif revision is None or self.state.revisions[item_id] != revision:
+            kind = UPDATED
+        else:
+            return None
+
+        self.state.revisions[item_id] = revision
+
+        return SyncChange(kind, item_id, item)
+
+    def _finish(self, full_pass: bool) -> Iterator[SyncChange]:
+        if full_pass:
+            for item_id in [i for i in self.state.revisions if i not in self._seen]:
+                del self.state.revisions[item_id]
+                yield SyncChange(DELETED, item_id, None)
+
+        if self._newest is not None:
+            previous = self.state.watermark
+            if previous is None or self._newest > _revision_time(previous):
+                self.state.watermark = self._newest.isoformat()
+
+    def run(self, items: Iterable[dict], ordered: bool = False) -> Iterator[SyncChange]:
+        """Sync from an entity iterator.
+
+        The watermark only advances once the run has been consumed to the end.
+
+        Args:
+            items: Entities to compare against the stored state
+            ordered: Whether items are sorted newest metadata.revision_at first
+
+        Yields:
+            Inserted, updated and (on full passes) deleted entities
+        """
+        watermark = self._start()
+        full_pass = True
+
+        for item in items:
+            if self._past_watermark(item, ordered, watermark):
+                full_pass = False
+                break
+
+            change = self._compare(item)
+            if change is not None:
+                yield change
+
+        yield from self._finish(full_pass)
+
+    async def run_async(
+        self, items: AsyncIterable[dict], ordered: bool = False
+    ) -> AsyncIterator[SyncChange]:
+        """Sync from an async entity iterator (e.g. from AsyncCFLClient).
+
+        Args:
+            items: Entities to compare against the stored state
+            ordered: Whether items are sorted newest metadata.revision_at first
+
+        Yields:
+            Inserted, updated and (on full passes) deleted entities
+        """
+        watermark = self._start()
+        full_pass = True
+
+        async for item in items:
+            if self._past_watermark(item, ordered, watermark):
+                full_pass = False
+                break
+
+            change = self._compare(item)
+            if change is not None:
+                yield change
+
+        for change in self._finish(full_pass):
+            yield change